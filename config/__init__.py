@@ -0,0 +1,3 @@
+"""
+Configuration package for the Coventry University Research Publications Crawler.
+"""
@@ -5,6 +5,8 @@ Configuration settings for the Coventry University Research Publications Crawler
 import os
 from pathlib import Path
 
+import soupsieve
+
 # Base directory
 BASE_DIR = Path(__file__).parent.parent
 
@@ -17,57 +19,141 @@ DELAY_BETWEEN_PAGES = 8  # seconds (increased by 5 seconds)
 DELAY_BETWEEN_REQUESTS = 1  # seconds
 MAX_RETRIES = 3
 TIMEOUT = 30  # seconds
+SLOW_PARSE_WARNING = 30  # seconds; listing pages parsing slower than this are logged
 
 # User agent
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
+# Headers for plain HTTP requests to the portal (outside Selenium)
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Fetch listing pages with a plain HTTP GET before driving Chrome. The crawler
+# switches to Selenium for the rest of the run the first time the static HTML
+# fails validation, or after HTTP_LISTING_MISS_LIMIT failed GETs in a row
+# (timeouts, connection errors, non-200 responses); a failed page is loaded with Selenium.
+HTTP_LISTING_FETCH = True
+HTTP_LISTING_MISS_LIMIT = 3
+# Same for publication detail pages: a page whose static HTML has no abstract is
+# loaded with Selenium, and after this many pages in a row where Selenium found an
+# abstract the static HTML lacked, Selenium is used for every remaining detail page.
+HTTP_DETAIL_FETCH = True
+HTTP_DETAIL_MISS_LIMIT = 3
+
+# Shared HTTP session pool: number of hosts cached / keep-alive connections per host
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 8
+# Shared session: connection attempts retried (with short backoff) before a request fails
+HTTP_CONNECT_RETRIES = 2
+
 # File paths
 LOG_DIR = BASE_DIR / "logs"
 DATA_DIR = BASE_DIR / "data"
 LOG_FILE = LOG_DIR / "crawler.log"
+# One JSON line per skipped publication (rewritten each run)
+SKIPPED_FILE = LOG_DIR / "skipped.jsonl"
+CACHE_DIR = BASE_DIR / ".cache"
+PAGINATION_CACHE = CACHE_DIR / "pages.pkl"
+DRIVER_PATH_CACHE = CACHE_DIR / "chromedriver_path"
+PUBLICATION_IDS_CACHE = CACHE_DIR / "publication_ids.pkl"
 
 # API Configuration
 API_ENDPOINT = "https://api.irapi.workers.dev/api/publications"
 API_IDS_ENDPOINT = "https://api.irapi.workers.dev/api/publications/ids"
 API_TIMEOUT = 30  # seconds
 API_RETRIES = 3
+# Existing publication IDs fetched from the API are reused by runs started within this window
+PUBLICATION_IDS_CACHE_TTL = 60 * 60  # seconds
+# Precomputed headers shared by every API request
+API_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "Coventry-Crawler/1.0",
+}
 # Test mode: post each detailed record immediately and log payload
 API_POST_EACH_DETAIL = False
-
-# Ensure directories exist
-LOG_DIR.mkdir(exist_ok=True)
-DATA_DIR.mkdir(exist_ok=True)
+# Test mode posts are sent by a background thread; crawling blocks only if this many are pending
+API_QUEUE_SIZE = 256
+# Posts queued within this window of each other are sent as one request of up to API_BATCH_SIZE
+API_FLUSH_INTERVAL = 2  # seconds
+API_BATCH_SIZE = 32
+# gzip request bodies of at least API_GZIP_MIN_BYTES (only if the API accepts Content-Encoding: gzip)
+API_GZIP_POSTS = False
+API_GZIP_MIN_BYTES = 1024
+# A 429/503 pauses every API send for Retry-After seconds (or an exponential backoff).
+# After this many failed sends in a row, sends fail fast for API_BREAKER_COOLDOWN seconds;
+# the pause doubles (up to API_BREAKER_MAX_COOLDOWN) while sends keep failing.
+API_BREAKER_THRESHOLD = 3
+API_BREAKER_COOLDOWN = 30  # seconds
+API_BREAKER_MAX_COOLDOWN = 300  # seconds
 
 # Selenium settings
 HEADLESS = True  # Set to False for debugging
 WINDOW_SIZE = (1920, 1080)
+# URL patterns Chrome is told not to load (the parser only needs the HTML)
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.css",
+    "*/analytics*", "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+]
+# host:port of a Chrome started with --remote-debugging-port; when it answers, the main
+# driver attaches to it instead of launching Chrome (None always launches a new one).
+# Quitting an attached session leaves that Chrome running for the next run.
+CHROME_DEBUGGER_ADDRESS = None  # e.g. "localhost:9222"
+# chromedriver is killed if driver.quit() has not returned after this long
+DRIVER_QUIT_TIMEOUT = 5  # seconds
 
 # Logging settings
 LOG_LEVEL = "INFO"
 LOG_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}"
+LOG_FILE_BUFFERING = 64 * 1024  # bytes buffered before the log file is written
+# Log every step of each detail crawl at INFO (otherwise at DEBUG; per-page summaries stay at INFO)
+DETAIL_LOG_VERBOSE = False
+# Skipped publications listed individually in the end-of-run statistics
+SKIPPED_SAMPLE_SIZE = 20
 
 # CSV settings
 CSV_ENCODING = "utf-8"
 CSV_DELIMITER = ","
+CSV_WRITE_BUFFER = 512 * 1024  # bytes
+# Column order of data/publications.csv; the file is appended page by page during the crawl
+CSV_COLUMNS = ["title", "year", "authors", "publication_link", "author_links", "page_number", "abstract"]
 
 # Publication extraction settings
-PUBLICATION_SELECTORS = {
-    "publication_container": "div.result-container",
+# Class of the per-publication <div> on listing pages; listing parses build only these subtrees
+LISTING_CONTAINER_CLASS = "result-container"
+_RAW_PUBLICATION_SELECTORS = {
+    "publication_container": f"div.{LISTING_CONTAINER_CLASS}",
     "title": "h3.title a",
     "authors": "div.rendering.person, div.rendering.person a, span.rendering.person",
     "year": "span.date, div.date",
     "publication_link": "h3.title a",
     "author_link": "div.rendering.person a, span.rendering.person a"
 }
+# Compiled once at import so every page reuses the parsed selectors
+PUBLICATION_SELECTORS = {name: soupsieve.compile(sel) for name, sel in _RAW_PUBLICATION_SELECTORS.items()}
+
+# Selenium readiness: a page is parsed as soon as one of these matches
+# (or the document finishes loading when nothing matches)
+LISTING_READY_SELECTOR = "ul.pager"  # rendered after the result list
+DETAIL_READY_SELECTOR = "div.rendering_researchoutput_abstractportal, div.rendering_abstractportal, div.textblock"
+# Pages loaded through Selenium are parsed from this element only (whole page if absent)
+CONTENT_SELECTOR = "main"
 
 # Pagination settings
 PAGINATION_SELECTOR = "ul.pager li a"
 NEXT_PAGE_SELECTOR = "a[rel='next']"
 LAST_PAGE_SELECTOR = "ul.pager li:last-child a"
 
+# Development runs (--save-csv) reuse the detected page count for this long
+PAGINATION_CACHE_TTL = 24 * 60 * 60  # seconds
+
 # Error handling
 MAX_CONSECUTIVE_ERRORS = 5
 ERROR_DELAY = 10  # seconds
+MAX_RETRY_DELAY = 30  # seconds; cap for the exponential retry backoff
 
 # Robots.txt compliance
 RESPECT_ROBOTS = True
@@ -75,7 +161,14 @@ ROBOTS_URL = f"{BASE_URL}/robots.txt"
 ROBOTS_USER_AGENT = USER_AGENT
 # If robots.txt specifies crawl-delay, it will be used; otherwise fall back to this:
 ROBOTS_FALLBACK_CRAWL_DELAY = DELAY_BETWEEN_PAGES
-
-# Parsing parallelism
-PARALLEL_PARSE = True
-PARSE_WORKERS = 4
+# Long runs fetch robots.txt again once the loaded rules are older than this
+ROBOTS_CACHE_TTL = 6 * 60 * 60  # seconds
+
+# Detail crawling parallelism: number of Chrome drivers used for detail pages.
+# Request starts are still spaced by the robots crawl-delay across all drivers.
+DETAIL_WORKERS = 2
+# Listing pages that may wait for detail crawling while the next listing page
+# is fetched (0 processes each page before fetching the next)
+PIPELINE_DEPTH = 1
+# On interrupt, how long to wait for the page worker to leave its current page before the drivers are closed
+PIPELINE_STOP_TIMEOUT = 10  # seconds
@@ -4,100 +4,117 @@ Main entry point for the Coventry University Research Publications Crawler.
 """
 
 import sys
-import traceback
-from pathlib import Path
-import signal
-import argparse
-from datetime import datetime
+import time
+from datetime import timedelta
 
-# Add src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+_SEP = "=" * 60
+_BANNER_TITLE = "COVENTRY UNIVERSITY PUBLICATIONS CRAWLER"
+_SUMMARY_TITLE = "PROGRAM EXECUTION SUMMARY"
+_INTERRUPTED_TITLE = "PROGRAM INTERRUPTED BY USER"
+_FAILED_TITLE = "PROGRAM FAILED"
 
-from src.crawler import CoventryPublicationsCrawler
-from src.utils import setup_logging
-from config.settings import LOG_FILE, API_ENDPOINT
+
+def _fmt(wall_time):
+    """Format a time.time() value for the console summary."""
+    return time.strftime(_TIMESTAMP_FORMAT, time.localtime(wall_time))
+
+
+def _print_summary(title, start_ts, start_mono, duration_label, extra_lines=(), show_seconds=False):
+    """Print the end-of-program banner with start/end times and elapsed duration."""
+    end_ts = _fmt(time.time())
+    duration_s = time.monotonic() - start_mono
+    
+    print("\n" + _SEP)
+    print(title)
+    print(_SEP)
+    print(f"Program Start: {start_ts}")
+    print(f"Program End: {end_ts}")
+    print(f"{duration_label}: {timedelta(seconds=duration_s)}")
+    if show_seconds:
+        print(f"{duration_label} (seconds): {duration_s:.2f}")
+    for line in extra_lines:
+        print(line)
+    print(_SEP)
+
+
+def _raise_interrupt(signum, frame):
+    """Signal handler that turns SIGTERM into KeyboardInterrupt."""
+    raise KeyboardInterrupt
+
+
+def parse_args(argv):
+    """
+    Parse command line flags and return whether CSV saving is enabled.
+    
+    The only supported flag is --save-csv, so it is sniffed directly from argv;
+    argparse is imported only to render --help or report invalid arguments.
+    """
+    if all(arg == "--save-csv" for arg in argv):
+        return "--save-csv" in argv
+    
+    import argparse
+    parser = argparse.ArgumentParser(description="Coventry Publications Crawler")
+    parser.add_argument("--save-csv", action="store_true", help="Enable CSV saving to data/publications.csv (development mode)")
+    return parser.parse_args(argv).save_csv
 
 
 def main():
     """Main function to run the crawler."""
-    program_start_time = datetime.now()
-    program_start_timestamp = program_start_time.strftime("%Y-%m-%d %H:%M:%S")
+    program_start_mono = time.monotonic()
+    program_start_timestamp = _fmt(time.time())
+    crawler = None
     
     try:
-        # Prevent BrokenPipeError noise when piping output
-        try:
+        import signal
+        # Prevent BrokenPipeError noise when piping output (SIGPIPE is POSIX-only)
+        if sys.platform != "win32":
             signal.signal(signal.SIGPIPE, signal.SIG_DFL)
-        except Exception:
-            pass
+        
+        # Treat SIGTERM like Ctrl-C so the crawler shuts Chrome down instead of leaving it running
+        signal.signal(signal.SIGTERM, _raise_interrupt)
         
         # CLI args
-        parser = argparse.ArgumentParser(description="Coventry Publications Crawler")
-        parser.add_argument("--save-csv", action="store_true", help="Enable CSV saving to data/publications.csv (development mode)")
-        args = parser.parse_args()
+        save_csv = parse_args(sys.argv[1:])
         
-        print(f"\n{'='*60}")
-        print(f"COVENTRY UNIVERSITY PUBLICATIONS CRAWLER")
-        print(f"{'='*60}")
-        print(f"Program Start Time: {program_start_timestamp}")
-        print(f"CSV Save Mode: {'Enabled' if args.save_csv else 'Disabled'}")
-        print(f"{'='*60}")
+        # Heavy imports (Selenium, requests, bs4) are deferred until the
+        # arguments are valid so that --help and usage errors return immediately
+        from src.crawler import CoventryPublicationsCrawler
+        from config.settings import LOG_FILE, API_ENDPOINT
         
-        # Setup logging
-        setup_logging()
+        print("\n" + _SEP)
+        print(_BANNER_TITLE)
+        print(_SEP)
+        print(f"Program Start Time: {program_start_timestamp}")
+        print(f"CSV Save Mode: {'Enabled' if save_csv else 'Disabled'}")
+        print(_SEP)
         
-        # Create crawler instance
-        crawler = CoventryPublicationsCrawler(save_csv=args.save_csv)
+        # Create crawler instance (configures logging on construction)
+        crawler = CoventryPublicationsCrawler(save_csv=save_csv)
         
         # Run the crawler
         crawler.run()
         
-        # Calculate total program time
-        program_end_time = datetime.now()
-        program_end_timestamp = program_end_time.strftime("%Y-%m-%d %H:%M:%S")
-        program_total_duration = program_end_time - program_start_time
-        
-        print(f"\n{'='*60}")
-        print(f"PROGRAM EXECUTION SUMMARY")
-        print(f"{'='*60}")
-        print(f"Program Start: {program_start_timestamp}")
-        print(f"Program End: {program_end_timestamp}")
-        print(f"Total Program Duration: {program_total_duration}")
-        print(f"Total Program Duration (seconds): {program_total_duration.total_seconds():.2f}")
-        print(f"Results sent to API: {API_ENDPOINT}")
-        print(f"Logs saved to: {LOG_FILE}")
-        print(f"{'='*60}")
+        _print_summary(
+            _SUMMARY_TITLE, program_start_timestamp, program_start_mono, "Total Program Duration",
+            extra_lines=(f"Results sent to API: {API_ENDPOINT}", f"Logs saved to: {LOG_FILE}"),
+            show_seconds=True,
+        )
         
     except KeyboardInterrupt:
-        program_end_time = datetime.now()
-        program_end_timestamp = program_end_time.strftime("%Y-%m-%d %H:%M:%S")
-        program_total_duration = program_end_time - program_start_time
-        
-        print(f"\n{'='*60}")
-        print(f"PROGRAM INTERRUPTED BY USER")
-        print(f"{'='*60}")
-        print(f"Program Start: {program_start_timestamp}")
-        print(f"Program End: {program_end_timestamp}")
-        print(f"Duration before interruption: {program_total_duration}")
-        print(f"{'='*60}")
-        
+        _print_summary(_INTERRUPTED_TITLE, program_start_timestamp, program_start_mono, "Duration before interruption")
         sys.exit(1)
         
     except Exception as e:
-        program_end_time = datetime.now()
-        program_end_timestamp = program_end_time.strftime("%Y-%m-%d %H:%M:%S")
-        program_total_duration = program_end_time - program_start_time
-        
-        print(f"\n{'='*60}")
-        print(f"PROGRAM FAILED")
-        print(f"{'='*60}")
-        print(f"Program Start: {program_start_timestamp}")
-        print(f"Program End: {program_end_timestamp}")
-        print(f"Duration before failure: {program_total_duration}")
-        print(f"Error: {e}")
-        print(f"Check the log file for details: {LOG_FILE}")
-        print(f"{'='*60}")
-        
-        traceback.print_exc()
+        from config.settings import LOG_FILE
+        _print_summary(
+            _FAILED_TITLE, program_start_timestamp, program_start_mono, "Duration before failure",
+            extra_lines=(f"Error: {e}", f"Check the log file for details: {LOG_FILE}"),
+        )
+        # Failures inside crawler.run() were already logged with their traceback
+        if crawler is None:
+            import traceback
+            traceback.print_exc()
         sys.exit(1)
 
 
@@ -2,115 +2,231 @@
 Main crawler implementation using Selenium for Coventry University research publications.
 """
 
+import json
+import os
+import platform
+import random
+import re
+import threading
 import time
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import timedelta
+from pathlib import Path
+from queue import Empty, Queue
+import requests
 from typing import List, Dict, Any, Optional
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 from loguru import logger
 
 from src.parser import PublicationParser
-from src.utils import delay, send_to_api, create_backup_file, get_crawling_statistics, save_to_csv, fetch_text_via_selenium, fetch_existing_publication_ids, send_single_to_api
+from src.utils import setup_logging, detail_log, delay, send_to_api, CrawlingStatistics, PublicationCsvWriter, fetch_text_via_selenium, fetch_existing_publication_ids, send_single_to_api, api_available, save_publication_ids_cache
+from src.utils import load_cached_total_pages, save_cached_total_pages, fetch_html, resolve_host, RobotsPolicy
+from src.utils import load_cached_driver_path, save_cached_driver_path, timed, get_page_number_from_url, is_publication_exists
 from config.settings import (
     SEED_URL, DELAY_BETWEEN_PAGES, DELAY_BETWEEN_REQUESTS, 
     MAX_RETRIES, TIMEOUT, USER_AGENT, HEADLESS, WINDOW_SIZE,
-    MAX_CONSECUTIVE_ERRORS, ERROR_DELAY, DATA_DIR, PARALLEL_PARSE, PARSE_WORKERS
+    MAX_CONSECUTIVE_ERRORS, ERROR_DELAY, MAX_RETRY_DELAY, DATA_DIR,
+    HTTP_LISTING_FETCH, HTTP_LISTING_MISS_LIMIT, HTTP_DETAIL_FETCH, HTTP_DETAIL_MISS_LIMIT, DETAIL_WORKERS, SLOW_PARSE_WARNING, BLOCKED_RESOURCE_PATTERNS,
+    LISTING_READY_SELECTOR, DETAIL_READY_SELECTOR, CONTENT_SELECTOR, PIPELINE_DEPTH, PIPELINE_STOP_TIMEOUT, DRIVER_QUIT_TIMEOUT,
+    CHROME_DEBUGGER_ADDRESS, SKIPPED_FILE, SKIPPED_SAMPLE_SIZE
 )
-from config.settings import API_POST_EACH_DETAIL
-
-# robots
-from src.utils import RobotsPolicy
+from config.settings import API_POST_EACH_DETAIL, API_QUEUE_SIZE, API_BATCH_SIZE, API_FLUSH_INTERVAL
 from config.settings import RESPECT_ROBOTS, ROBOTS_USER_AGENT, ROBOTS_URL
 
-# typing for queues
-from queue import Queue
-from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import time as _time
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+_BAR = "=" * 60
+
+# outerHTML of the first element matching arguments[0], or "" when none does
+_OUTER_HTML_SCRIPT = "var e = document.querySelector(arguments[0]); return e ? e.outerHTML : '';"
+
+# Markup around robots.txt when Chrome renders it as an HTML page
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# The page query parameter of a listing URL (prefix kept in group 1)
+_PAGE_RE = re.compile(r"([?&]page=)\d+")
+
+
+def _with_page_index(url: str, index: int) -> str:
+    """Return url with its page query parameter set to index (appended when missing)."""
+    new_url, count = _PAGE_RE.subn(lambda m: f"{m.group(1)}{index}", url, count=1)
+    if count:
+        return new_url
+    return f"{url}{'&' if '?' in url else '?'}page={index}"
+
+
+def _next_listing_url(url: str, total_pages: Optional[int]) -> Optional[str]:
+    """Return the URL of the listing page after url, or None when url is the last page."""
+    next_index = get_page_number_from_url(url) + 1
+    if total_pages is not None and next_index >= total_pages:
+        return None
+    return _with_page_index(url, next_index)
+
+
+def _report(status: str, start: str, end: str, duration: float, err: Optional[Exception] = None):
+    """Log the end-of-run banner (at ERROR level when err is given); the console sink prints it."""
+    lines = [_BAR, status, _BAR, f"Start Time: {start}", f"End Time: {end}"]
+    if err is None:
+        lines += [f"Total Duration: {timedelta(seconds=duration)}", f"Total Duration (seconds): {duration:.2f}"]
+    else:
+        lines += [f"Duration before failure: {timedelta(seconds=duration)}", f"Error: {err}"]
+    lines.append(_BAR)
+    
+    log = logger.info if err is None else logger.error
+    log("\n{}", "\n".join(lines))
 
 
 class CoventryPublicationsCrawler:
     """Main crawler for Coventry University research publications."""
     
+    # ChromeDriver path that last started a driver in this process (detail drivers reuse it)
+    _driver_path: Optional[str] = None
+    
     def __init__(self, save_csv: bool = False):
+        # Attach log sinks only once a crawler is actually built
+        setup_logging()
         self.driver = None
         self.parser = PublicationParser()
-        self.all_publications: List[Dict[str, Any]] = []
+        # Publications are counted and (with --save-csv) appended to the CSV page by page, not kept
+        self.stats = CrawlingStatistics()
+        # Opened (and the previous file backed up) when the first page is written
+        self._csv_writer: Optional[PublicationCsvWriter] = PublicationCsvWriter(Path(DATA_DIR) / "publications.csv") if save_csv else None
         self.consecutive_errors = 0
         self.current_page = 0
-        self.skipped_records: List[Dict[str, Any]] = []  # Keep track of skipped publications and reasons
+        # Skipped publications: every record goes to SKIPPED_FILE, only counts and the first few stay in memory
+        self.skipped_records: List[Dict[str, Any]] = []  # first SKIPPED_SAMPLE_SIZE records
+        self.skipped_count = 0
+        self.skipped_reasons: Counter = Counter()
+        self._skipped_file = None
+        self._skipped_lock = threading.Lock()
         # Dev-mode CSV saving flag
         self.save_csv_flag = save_csv
         # Always fetch robots.txt from the site's base URL
         self.robots = RobotsPolicy(ROBOTS_URL, ROBOTS_USER_AGENT)
+        # HTML and URL of the listing page currently being processed, whichever way it was fetched
+        self._current_html: Optional[str] = None
+        self._current_url: Optional[str] = None
+        # Publications and total page count read from that HTML when it was validated
+        self._current_publications: Optional[List[Dict[str, Any]]] = None
+        self._current_total_pages: Optional[int] = None
+        # Cleared when static listing HTML fails validation or HTTP_LISTING_MISS_LIMIT GETs in a row fail
+        self._http_listing = HTTP_LISTING_FETCH
+        self._http_listing_misses = 0
+        # Cleared after HTTP_DETAIL_MISS_LIMIT detail pages in a row need Selenium
+        self._http_detail = HTTP_DETAIL_FETCH
+        self._http_detail_misses = 0
+        # Detail workers update the two fields above concurrently
+        self._http_detail_lock = threading.Lock()
+        # Start time of the next request allowed by the crawl-delay, shared across threads
+        self._request_slot_lock = threading.Lock()
+        self._next_request_at = 0.0
+        # Held while the main driver loads a page (listing and detail work may overlap)
+        self._driver_lock = threading.Lock()
+        # Listing pages waiting for detail crawling and API submission (see _page_worker)
+        self._page_queue: Queue = Queue(maxsize=max(PIPELINE_DEPTH, 1))
+        self._page_thread: Optional[threading.Thread] = None
+        # Set on interrupt: the page worker and detail crawls stop before touching drivers or the API again
+        self._stopping = threading.Event()
+        # Detail crawling workers (created on first use when DETAIL_WORKERS > 1)
+        self._detail_drivers: Queue = Queue()
+        self._extra_drivers: List[Any] = []
+        self._detail_pool: Optional[ThreadPoolExecutor] = None
+        # Test mode (API_POST_EACH_DETAIL): enhanced publications waiting to be posted one by one
+        self._api_queue: Queue = Queue(maxsize=API_QUEUE_SIZE)
+        if API_POST_EACH_DETAIL:
+            threading.Thread(target=self._api_flusher, name="api", daemon=True).start()
         
     def _normalize_query_url(self, url: str) -> str:
         """Ensure no trailing slash before a query string (…/path?page=1, not …/path/?page=1)."""
-        try:
-            from urllib.parse import urlparse, urlunparse
-            parsed = urlparse(url)
-            path = parsed.path
-            if parsed.query and path.endswith('/'):
-                path = path.rstrip('/')
-            return urlunparse(parsed._replace(path=path))
-        except Exception:
-            # Fallback simple normalization
-            return url.replace('/?', '?')
+        # Plain string split: the query starts at the first '?', and only a slash right before it changes
+        base, sep, query = url.partition('?')
+        if not query or not base.endswith('/'):
+            return url
+        return f"{base.rstrip('/')}{sep}{query}"
 
     def setup_driver(self):
-        """Setup Chrome WebDriver with appropriate options."""
+        """Setup the main Chrome WebDriver, reusing the Chrome at CHROME_DEBUGGER_ADDRESS when one is running."""
+        if CHROME_DEBUGGER_ADDRESS and self._debugger_listening(CHROME_DEBUGGER_ADDRESS):
+            try:
+                self.driver = self._create_driver(debugger_address=CHROME_DEBUGGER_ADDRESS)
+                logger.info(f"Attached to running Chrome at {CHROME_DEBUGGER_ADDRESS}")
+                return
+            except Exception as e:
+                logger.warning(f"Could not attach to Chrome at {CHROME_DEBUGGER_ADDRESS}, launching a new one: {e}")
+        self.driver = self._create_driver()
+    
+    @staticmethod
+    def _debugger_listening(address: str) -> bool:
+        """Return True if a Chrome DevTools endpoint answers at address (host:port)."""
+        # Deliberately not the shared utils session: its connect retries (with backoff) would
+        # slow every start when no Chrome is listening, and this local
+        # probe gains nothing from the portal's keep-alive pool
+        try:
+            return requests.get(f"http://{address}/json/version", timeout=1).ok
+        except requests.RequestException:
+            return False
+    
+    def _create_driver(self, debugger_address: Optional[str] = None):
+        """
+        Create a Chrome WebDriver with appropriate options.
+        
+        Args:
+            debugger_address: host:port of a running Chrome to attach to instead of launching one
+        """
+        # Driver construction pulls in the bulk of Selenium and webdriver-manager;
+        # import here so loading this module stays cheap
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+        
         try:
             chrome_options = Options()
+            # Return from driver.get() at DOMContentLoaded; _wait_until_ready waits for the content we parse
+            chrome_options.page_load_strategy = "eager"
             
-            if HEADLESS:
-                chrome_options.add_argument("--headless")
-            
-            chrome_options.add_argument(f"--user-agent={USER_AGENT}")
-            chrome_options.add_argument(f"--window-size={WINDOW_SIZE[0]},{WINDOW_SIZE[1]}")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-images")  # Speed up loading
+            if debugger_address:
+                # Attach to an already running Chrome; launch flags and prefs do not apply
+                chrome_options.debugger_address = debugger_address
+            else:
+                if HEADLESS:
+                    chrome_options.add_argument("--headless")
+                
+                chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+                chrome_options.add_argument(f"--window-size={WINDOW_SIZE[0]},{WINDOW_SIZE[1]}")
+                chrome_options.add_argument("--no-sandbox")
+                chrome_options.add_argument("--disable-dev-shm-usage")
+                chrome_options.add_argument("--disable-gpu")
+                chrome_options.add_argument("--disable-extensions")
+                chrome_options.add_argument("--disable-images")  # Speed up loading
+                chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+                chrome_options.add_experimental_option("prefs", {
+                    "profile.managed_default_content_settings.images": 2,
+                    "profile.managed_default_content_settings.stylesheets": 2,
+                })
             # chrome_options.add_argument("--disable-javascript")  # Disable JS if not needed
             
-            # Setup ChromeDriver with proper path handling for macOS ARM64
+            # Setup ChromeDriver, reusing the path resolved by an earlier run when it still works
             try:
-                driver_path = ChromeDriverManager().install()
-                logger.info(f"ChromeDriver path: {driver_path}")
-                
-                # For macOS ARM64, we need to find the actual chromedriver executable
-                import os
-                import platform
-                
-                if platform.system() == "Darwin" and platform.machine() == "arm64":
-                    # Look for the actual chromedriver executable in the directory
-                    driver_dir = os.path.dirname(driver_path)
-                    possible_drivers = [
-                        os.path.join(driver_dir, "chromedriver"),
-                        os.path.join(driver_dir, "chromedriver-mac-arm64"),
-                        os.path.join(driver_dir, "chromedriver-mac-x64")
-                    ]
-                    
-                    for driver in possible_drivers:
-                        if os.path.exists(driver) and os.access(driver, os.X_OK):
-                            driver_path = driver
-                            logger.info(f"Found executable ChromeDriver: {driver_path}")
-                            break
-                    else:
-                        # If no executable found, try to make the original path executable
-                        if os.path.exists(driver_path):
-                            os.chmod(driver_path, 0o755)
-                            logger.info(f"Made ChromeDriver executable: {driver_path}")
+                driver = None
+                driver_path = CoventryPublicationsCrawler._driver_path
+                if driver_path is None:
+                    driver_path = load_cached_driver_path()
+                    if driver_path:
+                        logger.info(f"Using cached ChromeDriver path: {driver_path}")
+                if driver_path:
+                    try:
+                        driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+                    except Exception as cached_error:
+                        logger.warning(f"Cached ChromeDriver failed, resolving it again: {cached_error}")
                 
-                service = Service(driver_path)
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                if driver is None:
+                    driver_path = self._resolve_driver_path()
+                    driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+                    save_cached_driver_path(driver_path)
+                CoventryPublicationsCrawler._driver_path = driver_path
                 
             except Exception as driver_error:
                 logger.warning(f"ChromeDriverManager failed: {driver_error}")
@@ -118,28 +234,104 @@ class CoventryPublicationsCrawler:
                 
                 # Fallback: try to use system ChromeDriver
                 try:
-                    self.driver = webdriver.Chrome(options=chrome_options)
+                    driver = webdriver.Chrome(options=chrome_options)
                 except Exception as fallback_error:
                     logger.error(f"Fallback ChromeDriver also failed: {fallback_error}")
                     raise driver_error
             
             # Set page load timeout
-            self.driver.set_page_load_timeout(TIMEOUT)
+            driver.set_page_load_timeout(TIMEOUT)
+            
+            # The parser only reads HTML, so skip images, stylesheets, fonts and trackers
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_PATTERNS})
+                if debugger_address:
+                    # The attached browser was not started with our --user-agent flag
+                    driver.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": USER_AGENT})
+            except Exception as e:
+                logger.warning(f"Could not block page resources via CDP: {e}")
             
             logger.info("Chrome WebDriver setup completed successfully")
+            return driver
             
         except Exception as e:
             logger.error(f"Failed to setup WebDriver: {e}")
             raise
     
-    def close_driver(self):
-        """Close the WebDriver."""
+    @staticmethod
+    def _resolve_driver_path() -> str:
+        """Install ChromeDriver via webdriver-manager and return the executable path."""
+        from webdriver_manager.chrome import ChromeDriverManager
+        
+        driver_path = ChromeDriverManager().install()
+        logger.info(f"ChromeDriver path: {driver_path}")
+        
+        # For macOS ARM64, we need to find the actual chromedriver executable
+        if platform.system() == "Darwin" and platform.machine() == "arm64":
+            # Look for the actual chromedriver executable in the directory
+            driver_dir = os.path.dirname(driver_path)
+            possible_drivers = [
+                os.path.join(driver_dir, "chromedriver"),
+                os.path.join(driver_dir, "chromedriver-mac-arm64"),
+                os.path.join(driver_dir, "chromedriver-mac-x64")
+            ]
+            
+            # os.access() is False for missing files, so no separate exists() probe is needed
+            executable = next((candidate for candidate in possible_drivers if os.access(candidate, os.X_OK)), None)
+            if executable:
+                driver_path = executable
+                logger.info(f"Found executable ChromeDriver: {driver_path}")
+            elif os.path.exists(driver_path):
+                # If no executable found, try to make the original path executable
+                os.chmod(driver_path, 0o755)
+                logger.info(f"Made ChromeDriver executable: {driver_path}")
+        
+        return driver_path
+    
+    def close_driver(self, wait: bool = True):
+        """
+        Close the WebDriver and any extra detail drivers, the output files, and save the publication ID cache.
+        
+        Args:
+            wait: Let running detail crawls finish first; when False (on interrupt)
+                queued detail crawls are cancelled and the drivers are closed at once
+        """
+        if self._detail_pool is not None:
+            self._detail_pool.shutdown(wait=wait, cancel_futures=not wait)
+            self._detail_pool = None
+        for driver in self._extra_drivers:
+            try:
+                self._quit_driver(driver)
+            except Exception as e:
+                logger.error(f"Error closing detail WebDriver: {e}")
+        self._extra_drivers = []
         if self.driver:
             try:
-                self.driver.quit()
+                self._quit_driver(self.driver)
                 logger.info("WebDriver closed successfully")
             except Exception as e:
                 logger.error(f"Error closing WebDriver: {e}")
+            self.driver = None
+        self._close_skipped_file()
+        if self._csv_writer is not None:
+            self._csv_writer.close()
+        save_publication_ids_cache()
+    
+    @staticmethod
+    def _quit_driver(driver):
+        """Quit a driver, killing its chromedriver process if quit() takes longer than DRIVER_QUIT_TIMEOUT."""
+        process = getattr(getattr(driver, "service", None), "process", None)
+        killer = None
+        if process is not None:
+            killer = threading.Timer(DRIVER_QUIT_TIMEOUT, process.kill)
+            killer.daemon = True
+            killer.start()
+        try:
+            driver.quit()
+        finally:
+            if killer is not None:
+                killer.cancel()
     
     def _respect_robots_or_skip(self, url: str) -> bool:
         """Check robots rules for the URL; returns True if allowed, False otherwise."""
@@ -155,19 +347,33 @@ class CoventryPublicationsCrawler:
             return True
     
     def _delay_per_robots(self):
+        """
+        Wait for the next request slot allowed by the robots crawl-delay.
+        
+        Slots are shared by the main loop and all detail workers, so successive
+        requests to the site start at least crawl-delay seconds apart while time
+        spent loading and parsing counts towards the wait.
+        """
         try:
             delay_seconds = self.robots.crawl_delay_seconds()
-            logger.info(f"Respecting crawl-delay: {delay_seconds}s")
-            delay(delay_seconds)
         except Exception:
-            delay(DELAY_BETWEEN_PAGES)
+            delay_seconds = DELAY_BETWEEN_PAGES
+        with self._request_slot_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_at)
+            self._next_request_at = slot + delay_seconds
+        wait = slot - now
+        logger.info("Respecting crawl-delay: {}s (waiting {:.2f}s)", delay_seconds, wait)
+        if wait > 0:
+            delay(wait)
     
-    def navigate_to_page(self, url: str) -> bool:
+    def navigate_to_page(self, url: str, detect_total_pages: bool = False) -> bool:
         """
         Navigate to a specific URL with error handling and retries.
         
         Args:
             url: URL to navigate to
+            detect_total_pages: Also read the total page count from the pagination
             
         Returns:
             True if navigation successful, False otherwise
@@ -175,37 +381,43 @@ class CoventryPublicationsCrawler:
         if self.driver is None:
             logger.error("WebDriver not initialized")
             return False
+        self._current_html = None
+        self._current_publications = None
+        self._current_total_pages = None
         if not self._respect_robots_or_skip(url):
             return False
+        if self._http_listing:
+            if self._fetch_listing_via_http(url, detect_total_pages):
+                return True
+            # The failed GET used this page's crawl-delay slot; wait for another before Chrome loads it
+            self._delay_per_robots()
         for attempt in range(MAX_RETRIES):
             try:
-                logger.info(f"Navigating to page {self.current_page + 1}: {url}")
-                _t0 = _time.perf_counter()
-                self.driver.get(url)
-                
-                # Wait for page to load
-                WebDriverWait(self.driver, TIMEOUT).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-                _t1 = _time.perf_counter()
-                logger.info(f"Page load time: {(_t1 - _t0):.2f}s for {url}")
-                
-                # Additional delay to ensure page is fully loaded
-                delay(2)
+                logger.info("Navigating to page {}: {}", self.current_page + 1, url)
+                # The main driver may also be crawling detail pages for the previous page
+                with self._driver_lock:
+                    _t0 = time.perf_counter()
+                    self.driver.get(url)
+                    
+                    # Wait for the listing content the parser needs
+                    self._wait_until_ready(self.driver, LISTING_READY_SELECTOR)
+                    _t1 = time.perf_counter()
+                    logger.info("Page load time: {:.2f}s for {}", _t1 - _t0, url)
+                    
+                    page_source = self._content_html(self.driver)
                 
-                # Validate page content
-                page_source = self.driver.page_source
-                if self.parser.validate_page_content(page_source):
+                # Validate page content (parsed once for validation and extraction)
+                if self._accept_listing(page_source, url, detect_total_pages):
                     self.consecutive_errors = 0  # Reset error counter
                     return True
                 else:
-                    logger.warning(f"Page content validation failed for: {url}")
+                    logger.warning("Page content validation failed for: {}", url)
                     return False
                     
             except TimeoutException:
-                logger.warning(f"Timeout on attempt {attempt + 1} for URL: {url}")
+                logger.warning("Timeout on attempt {} for URL: {}", attempt + 1, url)
                 if attempt < MAX_RETRIES - 1:
-                    delay(ERROR_DELAY)
+                    delay(self._retry_delay(attempt))
                     continue
                 else:
                     logger.error(f"Failed to load page after {MAX_RETRIES} attempts: {url}")
@@ -214,7 +426,7 @@ class CoventryPublicationsCrawler:
             except WebDriverException as e:
                 logger.error(f"WebDriver error on attempt {attempt + 1}: {e}")
                 if attempt < MAX_RETRIES - 1:
-                    delay(ERROR_DELAY)
+                    delay(self._retry_delay(attempt))
                     continue
                 else:
                     return False
@@ -225,6 +437,91 @@ class CoventryPublicationsCrawler:
         
         return False
     
+    def _fetch_listing_via_http(self, url: str, detect_total_pages: bool = False) -> bool:
+        """
+        Try to load a listing page with a plain HTTP GET instead of Chrome.
+        
+        Args:
+            url: Listing page URL
+            detect_total_pages: Also read the total page count from the pagination
+            
+        Returns:
+            True if the static HTML is a valid listing page, False to fall back to Selenium
+        """
+        logger.info("Fetching page {} over HTTP: {}", self.current_page + 1, url)
+        _t0 = time.perf_counter()
+        html = fetch_html(url)
+        _t1 = time.perf_counter()
+        if html is None:
+            # Timeout, connection error or non-200: likely transient, so only a run of them disables HTTP
+            self._http_listing_misses += 1
+            if self._http_listing_misses >= HTTP_LISTING_MISS_LIMIT:
+                logger.warning("{} listing GETs failed in a row; using Selenium for listing pages from now on", self._http_listing_misses)
+                self._http_listing = False
+            return False
+        self._http_listing_misses = 0
+        if self._accept_listing(html, url, detect_total_pages):
+            logger.info("Page load time: {:.2f}s for {} (HTTP)", _t1 - _t0, url)
+            self.consecutive_errors = 0
+            return True
+        logger.warning("Static listing HTML unusable; using Selenium for listing pages from now on")
+        self._http_listing = False
+        return False
+    
+    def _accept_listing(self, html: str, url: str, detect_total_pages: bool = False) -> bool:
+        """
+        Validate a loaded listing page and keep its HTML, publications and page count.
+        
+        Returns:
+            True if the HTML is a valid listing page
+        """
+        parse_start = time.perf_counter()
+        valid, publications, total_pages = self.parser.scan_listing(html, url, with_total_pages=detect_total_pages)
+        parse_time = time.perf_counter() - parse_start
+        if parse_time > SLOW_PARSE_WARNING:
+            logger.warning("Parsing page {} took {:.2f}s", self.current_page + 1, parse_time)
+        if not valid:
+            return False
+        self._current_html = html
+        self._current_url = url
+        self._current_publications = publications
+        self._current_total_pages = total_pages
+        return True
+    
+    @staticmethod
+    def _content_html(driver) -> str:
+        """
+        Return the HTML of the page's main content element, or the whole page without one.
+        
+        Serializing only that subtree keeps headers, menus and footers out of the
+        transfer from Chrome and out of the parse.
+        """
+        try:
+            fragment = driver.execute_script(_OUTER_HTML_SCRIPT, CONTENT_SELECTOR)
+            if fragment:
+                return fragment
+        except WebDriverException as e:
+            logger.debug("Could not read content fragment, using full page source: {}", e)
+        return driver.page_source
+    
+    @staticmethod
+    def _retry_delay(attempt: int) -> float:
+        """Exponential backoff with jitter before retry number attempt + 1."""
+        return min(ERROR_DELAY * (2 ** attempt), MAX_RETRY_DELAY) + random.uniform(0, 0.5)
+    
+    @staticmethod
+    def _wait_until_ready(driver, selector: str):
+        """
+        Wait until the page shows the content we parse.
+        
+        Pages without a matching element (e.g. no abstract) are ready once the
+        document has finished loading. Raises TimeoutException after TIMEOUT.
+        """
+        WebDriverWait(driver, TIMEOUT, poll_frequency=0.1).until(
+            lambda d: d.find_elements(By.CSS_SELECTOR, selector)
+            or d.execute_script("return document.readyState") == "complete"
+        )
+    
     def extract_publications_from_page(self, url: str) -> List[Dict[str, Any]]:
         """
         Extract publications from the current page.
@@ -235,46 +532,25 @@ class CoventryPublicationsCrawler:
         Returns:
             List of publication dictionaries
         """
-        if self.driver is None:
+        if self._current_html is None and self.driver is None:
             logger.error("WebDriver not initialized")
             return []
         try:
-            import threading
-            import queue
-            
-            # Use a queue to get results from the parsing thread
-            result_queue: Queue = queue.Queue()
-            exception_queue: Queue = queue.Queue()
-            
-            def parse_with_timeout():
-                try:
-                    page_source = self.driver.page_source
-                    publications = self.parser.parse_publications_page(page_source, url)
-                    result_queue.put(publications)
-                except Exception as e:
-                    exception_queue.put(e)
+            # Normally already extracted when the page was validated
+            publications = self._current_publications
+            if publications is None:
+                page_source = self._current_html if self._current_html is not None else self.driver.page_source
+                parse_start = time.perf_counter()
+                publications = self.parser.parse_publications_page(page_source, url)
+                parse_time = time.perf_counter() - parse_start
+                if parse_time > SLOW_PARSE_WARNING:
+                    logger.warning("Parsing page {} took {:.2f}s", self.current_page + 1, parse_time)
             
-            # Start parsing in a separate thread
-            parse_thread = threading.Thread(target=parse_with_timeout)
-            parse_thread.daemon = True
-            parse_thread.start()
-            
-            # Wait for result with timeout (30 seconds)
-            try:
-                publications = result_queue.get(timeout=30)
-                
-                if publications:
-                    logger.info(f"Extracted {len(publications)} publications from page {self.current_page + 1}")
-                    return publications
-                else:
-                    logger.warning(f"No publications found on page {self.current_page + 1}")
-                    return []
-                    
-            except queue.Empty:
-                logger.error(f"Parsing timeout for page {self.current_page + 1}")
-                return []
-            except Exception as e:
-                logger.error(f"Error in parsing thread: {e}")
+            if publications:
+                logger.info("Extracted {} publications from page {}", len(publications), self.current_page + 1)
+                return publications
+            else:
+                logger.warning("No publications found on page {}", self.current_page + 1)
                 return []
                 
         except Exception as e:
@@ -288,16 +564,16 @@ class CoventryPublicationsCrawler:
         Returns:
             Next page URL or None if no next page
         """
-        if self.driver is None:
-            logger.error("WebDriver not initialized")
+        if self._current_html is None:
+            logger.error("No listing page loaded")
             return None
         try:
-            page_source = self.driver.page_source
-            current_url = self.driver.current_url
+            page_source = self._current_html
+            current_url = self._current_url
             next_url = self.parser.get_next_page_url(page_source, current_url)
             
             if next_url:
-                logger.info(f"Next page URL found: {next_url}")
+                logger.info("Next page URL found: {}", next_url)
                 # Check robots before returning
                 if self._respect_robots_or_skip(next_url):
                     return next_url
@@ -322,84 +598,70 @@ class CoventryPublicationsCrawler:
         Returns:
             List of processed publications (only new ones with enhanced details)
         """
-        from src.utils import is_publication_exists
-        
-        process_start_time = _time.perf_counter()
-        logger.info(f"Processing {len(publications)} publications for detail crawling...")
+        process_start_time = time.perf_counter()
+        logger.info("Processing {} publications for detail crawling...", len(publications))
         
+        page_number = current_page_number if current_page_number is not None else self.current_page
         processed_publications = []
+        new_publications = []
         skipped_count = 0
         detail_crawl_count = 0
         total_detail_crawl_time = 0.0
         
         for i, publication in enumerate(publications):
+            if self._stopping.is_set():
+                return []
             title = publication.get('title', '')
             publication_url = publication.get('publication_link', '')
             
-            logger.debug(f"Processing publication {i+1}/{len(publications)}: {title[:50]}...")
+            logger.debug("Processing publication {}/{}: {}...", i+1, len(publications), title[:50])
             
             if not title:
                 logger.warning("Skipping publication with no title")
-                try:
-                    self.skipped_records.append({
-                        "reason": "missing_title",
-                        "page_number": self.current_page,
-                        "index_on_page": i + 1,
-                        "title": title or "",
-                        "publication_link": publication.get('publication_link', '') or ""
-                    })
-                except Exception:
-                    pass
+                self._record_skip("missing_title", page_number, i + 1, title or "", publication.get('publication_link', '') or "")
                 continue
             
             # Check if publication already exists
             if is_publication_exists(title):
-                logger.info(f"Skipping existing publication: {title}")
+                logger.info("Skipping existing publication: {}", title)
                 skipped_count += 1
-                try:
-                    self.skipped_records.append({
-                        "reason": "already_exists",
-                        "page_number": self.current_page,
-                        "index_on_page": i + 1,
-                        "title": title,
-                        "publication_link": publication_url or ""
-                    })
-                except Exception:
-                    pass
+                self._record_skip("already_exists", page_number, i + 1, title, publication_url or "")
                 continue
             
-            # Publication is new - crawl details
-            logger.info(f"NEW PUBLICATION FOUND: {title}")
-            if publication_url and publication_url.startswith('http'):
-                detail_start_time = _time.perf_counter()
-                enhanced_publication = self.crawl_publication_details(publication_url, publication)
-                detail_end_time = _time.perf_counter()
-                detail_crawl_time = detail_end_time - detail_start_time
-                total_detail_crawl_time += detail_crawl_time
-                detail_crawl_count += 1
-                
-                if enhanced_publication:
-                    processed_publications.append(enhanced_publication)
-                    logger.info(f"Successfully enhanced publication details in {detail_crawl_time:.2f}s: {title}")
-                    # Test mode: send each detailed record to API immediately
-                    if API_POST_EACH_DETAIL:
-                        try:
-                            logger.info("Posting single enhanced publication to API (test mode)...")
-                            _api_t0 = _time.perf_counter()
-                            send_single_to_api(enhanced_publication)
-                            _api_t1 = _time.perf_counter()
-                            logger.info(f"Single API post time: {(_api_t1 - _api_t0):.2f}s for: {title}")
-                        except Exception as e:
-                            logger.warning(f"Failed to post single enhanced publication for '{title}': {e}")
-                else:
-                    # If detail crawling fails, use basic data
-                    logger.warning(f"Failed to crawl details for {title}, using basic data")
-                    processed_publications.append(publication)
+            # Publication is new - queue it for detail crawling
+            logger.info("NEW PUBLICATION FOUND: {}", title)
+            new_publications.append(publication)
+        
+        # Crawl detail pages (concurrently when detail workers are enabled), preserving listing order
+        detail_targets = [pub for pub in new_publications if (pub.get('publication_link') or '').startswith('http')]
+        detail_results = iter(self._crawl_details(detail_targets))
+        if self._stopping.is_set():
+            return []
+        
+        for publication in new_publications:
+            title = publication.get('title', '')
+            if not (publication.get('publication_link') or '').startswith('http'):
+                logger.warning("No valid URL for publication {}, using basic data", title)
+                processed_publications.append(publication)
+                continue
+            
+            enhanced_publication, detail_crawl_time = next(detail_results)
+            total_detail_crawl_time += detail_crawl_time
+            detail_crawl_count += 1
+            
+            if enhanced_publication:
+                processed_publications.append(enhanced_publication)
+                detail_log("Successfully enhanced publication details in {:.2f}s: {}", detail_crawl_time, title)
+                # Test mode: send each detailed record to API immediately
+                if API_POST_EACH_DETAIL:
+                    # Posted by the API flusher thread so crawling never waits on the API
+                    self._api_queue.put(enhanced_publication)
             else:
-                logger.warning(f"No valid URL for publication {title}, using basic data")
+                # If detail crawling fails, use basic data
+                logger.warning("Failed to crawl details for {}, using basic data", title)
                 processed_publications.append(publication)
         
-        process_end_time = _time.perf_counter()
+        process_end_time = time.perf_counter()
         total_process_time = process_end_time - process_start_time
         
         # Log comprehensive summary
@@ -407,144 +669,263 @@ class CoventryPublicationsCrawler:
         logger.info("PUBLICATION PROCESSING SUMMARY")
         logger.info("=" * 60)
         if current_page_number is not None:
-            logger.info(f"Page Number: {current_page_number}")
-        logger.info(f"Total publications processed: {len(publications)}")
-        logger.info(f"Existing publications skipped: {skipped_count}")
-        logger.info(f"New publications found: {len(processed_publications)}")
-        logger.info(f"Detail pages crawled: {detail_crawl_count}")
-        logger.info(f"Total processing time: {total_process_time:.2f}s")
+            logger.info("Page Number: {}", current_page_number)
+        logger.info("Total publications processed: {}", len(publications))
+        logger.info("Existing publications skipped: {}", skipped_count)
+        logger.info("New publications found: {}", len(processed_publications))
+        logger.info("Detail pages crawled: {}", detail_crawl_count)
+        logger.info("Total processing time: {:.2f}s", total_process_time)
         if detail_crawl_count > 0:
-            logger.info(f"Total detail crawling time: {total_detail_crawl_time:.2f}s")
-            logger.info(f"Average detail crawling time: {total_detail_crawl_time/detail_crawl_count:.2f}s per publication")
+            logger.info("Total detail crawling time: {:.2f}s", total_detail_crawl_time)
+            logger.info("Average detail crawling time: {:.2f}s per publication", total_detail_crawl_time/detail_crawl_count)
         logger.info("=" * 60)
         
         return processed_publications
     
-    def crawl_publication_details(self, publication_url: str, basic_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _crawl_details(self, publications: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Crawl detail pages for the given publications.
+        
+        Args:
+            publications: Publications with a valid detail link
+            
+        Returns:
+            List of (enhanced publication, crawl seconds) tuples in input order
+        """
+        if len(publications) > 1 and self._ensure_detail_pool():
+            return list(self._detail_pool.map(self._crawl_with_pooled_driver, publications))
+        return [self._timed_detail_crawl(pub, self.driver) for pub in publications]
+    
+    def _timed_detail_crawl(self, publication: Dict[str, Any], driver) -> Any:
+        """Crawl one detail page with the given driver and measure how long it took."""
+        if self._stopping.is_set():
+            return None, 0.0
+        detail_start_time = time.perf_counter()
+        enhanced_publication = self.crawl_publication_details(publication.get('publication_link', ''), publication, driver=driver)
+        return enhanced_publication, time.perf_counter() - detail_start_time
+    
+    def _crawl_with_pooled_driver(self, publication: Dict[str, Any]) -> Any:
+        """Detail-pool worker: borrow a driver, crawl one publication and return the driver."""
+        driver = self._detail_drivers.get()
+        try:
+            return self._timed_detail_crawl(publication, driver)
+        finally:
+            self._detail_drivers.put(driver)
+    
+    def _ensure_detail_pool(self) -> bool:
+        """Start the extra detail drivers and worker threads on first use; False if disabled."""
+        if self._detail_pool is not None:
+            return True
+        if DETAIL_WORKERS <= 1 or self.driver is None:
+            return False
+        
+        # Each worker owns one driver at a time (Selenium sessions are not thread-safe);
+        # the main driver joins the pool, guarded by _driver_lock against listing loads
+        self._detail_drivers.put(self.driver)
+        
+        # Launch the extra Chrome instances side by side; each start is mostly waiting on a child process
+        extra = DETAIL_WORKERS - 1
+        with ThreadPoolExecutor(max_workers=extra, thread_name_prefix="driver-start") as starter:
+            startups = [starter.submit(self._create_driver) for _ in range(extra)]
+        for startup in startups:
+            try:
+                driver = startup.result()
+            except Exception as e:
+                logger.warning("Could not start extra detail driver, continuing with fewer workers: {}", e)
+                continue
+            self._extra_drivers.append(driver)
+            self._detail_drivers.put(driver)
+        
+        workers = 1 + len(self._extra_drivers)
+        self._detail_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="detail")
+        logger.info("Detail crawling pool started with {} drivers", workers)
+        return True
+    
+    def crawl_publication_details(self, publication_url: str, basic_data: Dict[str, Any], driver=None) -> Optional[Dict[str, Any]]:
         """
         Crawl a single publication's detail page to extract abstract and detailed authors.
         
         Args:
             publication_url: URL of the publication detail page
             basic_data: Basic publication data from listing page
+            driver: WebDriver to use (defaults to the main driver)
             
         Returns:
             Enhanced publication data or None if crawling fails
         """
+        if driver is None:
+            driver = self.driver
         title = basic_data.get('title', 'Unknown')
-        crawl_start_time = _time.perf_counter()
+        crawl_start_time = time.perf_counter()
         
-        logger.info(f"Starting detail crawl for: {title}")
-        logger.info(f"Detail page URL: {publication_url}")
+        detail_log("Starting detail crawl for: {}", title)
+        detail_log("Detail page URL: {}", publication_url)
         
         if not publication_url or not publication_url.startswith('http'):
-            logger.warning(f"Invalid publication URL: {publication_url}")
+            logger.warning("Invalid publication URL: {}", publication_url)
             return basic_data
         
         # Check robots.txt for this URL
-        robots_check_start = _time.perf_counter()
+        robots_check_start = time.perf_counter()
         if not self._respect_robots_or_skip(publication_url):
-            logger.warning(f"Publication URL blocked by robots.txt: {publication_url}")
+            logger.warning("Publication URL blocked by robots.txt: {}", publication_url)
+            return basic_data
+        robots_check_end = time.perf_counter()
+        logger.debug("Robots.txt check completed in {:.3f}s", robots_check_end - robots_check_start)
+        
+        # Whether static HTML was tried and lacked the abstract (Selenium decides if that was a miss)
+        http_tried = False
+        if self._stopping.is_set():
+            return basic_data
+        if self._http_detail:
+            enhanced_data = self._fetch_detail_via_http(publication_url, basic_data)
+            if enhanced_data is not None and enhanced_data.get('abstract'):
+                self._record_http_detail(served=True)
+                crawl_end_time = time.perf_counter()
+                detail_log("Detail crawl completed successfully in {:.2f}s total (HTTP)", crawl_end_time - crawl_start_time)
+                return enhanced_data
+            http_tried = True
+        
+        # Check if driver is available (once, before any attempt takes a crawl-delay slot)
+        if driver is None:
+            logger.error("WebDriver not initialized for detail crawling")
             return basic_data
-        robots_check_end = _time.perf_counter()
-        logger.debug(f"Robots.txt check completed in {robots_check_end - robots_check_start:.3f}s")
         
         for attempt in range(MAX_RETRIES):
+            # On interrupt the drivers are being closed: skip the crawl-delay and any retries
+            if self._stopping.is_set():
+                return basic_data
             try:
-                logger.info(f"Detail crawl attempt {attempt + 1}/{MAX_RETRIES} for: {title}")
+                detail_log("Detail crawl attempt {}/{} for: {}", attempt + 1, MAX_RETRIES, title)
                 
                 # Add delay to respect robots.txt
-                delay_start = _time.perf_counter()
+                delay_start = time.perf_counter()
                 self._delay_per_robots()
-                delay_end = _time.perf_counter()
-                logger.debug(f"Robots crawl delay: {delay_end - delay_start:.2f}s")
-                
-                # Check if driver is available
-                if self.driver is None:
-                    logger.error("WebDriver not initialized for detail crawling")
-                    return basic_data
-                
-                # Navigate to publication detail page
-                logger.info(f"Navigating to detail page: {publication_url}")
-                nav_start = _time.perf_counter()
-                self.driver.get(publication_url)
-                
-                # Wait for page to load
-                logger.debug("Waiting for detail page to load...")
-                WebDriverWait(self.driver, TIMEOUT).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-                nav_end = _time.perf_counter()
-                page_load_time = nav_end - nav_start
-                logger.info(f"Detail page loaded successfully in {page_load_time:.2f}s")
+                delay_end = time.perf_counter()
+                logger.debug("Robots crawl delay: {:.2f}s", delay_end - delay_start)
                 
-                # Additional delay to ensure page is fully loaded
-                logger.debug("Additional page stabilization delay...")
-                delay(1)
-                
-                # Get page source and parse details
-                logger.info("Extracting abstract and detailed authors...")
-                parse_start = _time.perf_counter()
-                page_source = self.driver.page_source
+                # Listing pages loaded through Selenium share the main driver
+                with self._driver_lock if driver is self.driver else nullcontext():
+                    # Navigate to publication detail page
+                    detail_log("Navigating to detail page: {}", publication_url)
+                    nav_start = time.perf_counter()
+                    driver.get(publication_url)
+                    
+                    # Wait for the abstract section (or the finished document)
+                    logger.debug("Waiting for detail page to load...")
+                    self._wait_until_ready(driver, DETAIL_READY_SELECTOR)
+                    nav_end = time.perf_counter()
+                    page_load_time = nav_end - nav_start
+                    detail_log("Detail page loaded successfully in {:.2f}s", page_load_time)
+                    
+                    # Get page source and parse details
+                    detail_log("Extracting abstract and detailed authors...")
+                    parse_start = time.perf_counter()
+                    page_source = self._content_html(driver)
                 enhanced_data = self.parser.parse_publication_detail(page_source, publication_url, basic_data)
-                parse_end = _time.perf_counter()
+                parse_end = time.perf_counter()
                 parse_time = parse_end - parse_start
                 
                 # Log what was extracted
                 abstract = enhanced_data.get('abstract', '')
                 authors = enhanced_data.get('authors', '')
                 
-                logger.info(f"Detail parsing completed in {parse_time:.2f}s")
-                logger.info(f"Abstract extracted: {'Yes' if abstract else 'No'} ({len(abstract)} chars)")
-                logger.info(f"Authors extracted: {authors}")
+                detail_log("Detail parsing completed in {:.2f}s", parse_time)
+                detail_log("Abstract extracted: {} ({} chars)", 'Yes' if abstract else 'No', len(abstract))
+                detail_log("Authors extracted: {}", authors)
+                if http_tried:
+                    # A miss only if the rendered page has an abstract the static HTML did not
+                    self._record_http_detail(served=not abstract)
                 
-                crawl_end_time = _time.perf_counter()
+                crawl_end_time = time.perf_counter()
                 total_crawl_time = crawl_end_time - crawl_start_time
-                logger.info(f"Detail crawl completed successfully in {total_crawl_time:.2f}s total")
+                detail_log("Detail crawl completed successfully in {:.2f}s total", total_crawl_time)
                 
                 return enhanced_data
                 
             except TimeoutException:
-                logger.warning(f"Timeout on attempt {attempt + 1} for publication: {title}")
-                logger.warning(f"URL: {publication_url}")
+                logger.warning("Timeout on attempt {} for publication: {}", attempt + 1, title)
+                logger.warning("URL: {}", publication_url)
+                if self._stopping.is_set():
+                    return basic_data
                 if attempt < MAX_RETRIES - 1:
-                    logger.info(f"Retrying in {ERROR_DELAY} seconds...")
-                    delay(ERROR_DELAY)
+                    retry_in = self._retry_delay(attempt)
+                    logger.info("Retrying in {:.1f} seconds...", retry_in)
+                    delay(retry_in)
                     continue
                 else:
-                    logger.error(f"Failed to load publication page after {MAX_RETRIES} attempts: {title}")
+                    logger.error("Failed to load publication page after {} attempts: {}", MAX_RETRIES, title)
                     return basic_data
                     
             except WebDriverException as e:
-                logger.error(f"WebDriver error on attempt {attempt + 1} for {title}: {e}")
+                logger.error("WebDriver error on attempt {} for {}: {}", attempt + 1, title, e)
+                if self._stopping.is_set():
+                    return basic_data
                 if attempt < MAX_RETRIES - 1:
-                    logger.info(f"Retrying in {ERROR_DELAY} seconds...")
-                    delay(ERROR_DELAY)
+                    retry_in = self._retry_delay(attempt)
+                    logger.info("Retrying in {:.1f} seconds...", retry_in)
+                    delay(retry_in)
                     continue
                 else:
-                    logger.error(f"WebDriver failed permanently for: {title}")
+                    logger.error("WebDriver failed permanently for: {}", title)
                     return basic_data
                     
             except Exception as e:
-                logger.error(f"Unexpected error crawling details for {title}: {e}")
-                logger.error(f"URL: {publication_url}")
+                logger.error("Unexpected error crawling details for {}: {}", title, e)
+                logger.error("URL: {}", publication_url)
                 return basic_data
         
-        crawl_end_time = _time.perf_counter()
+        crawl_end_time = time.perf_counter()
         total_crawl_time = crawl_end_time - crawl_start_time
-        logger.warning(f"Detail crawl failed after all attempts in {total_crawl_time:.2f}s: {title}")
+        logger.warning("Detail crawl failed after all attempts in {:.2f}s: {}", total_crawl_time, title)
         return basic_data
 
+    def _fetch_detail_via_http(self, publication_url: str, basic_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Try to read a detail page's abstract and authors from a plain HTTP GET.
+        
+        Args:
+            publication_url: URL of the publication detail page
+            basic_data: Basic publication data from listing page
+            
+        Returns:
+            Enhanced publication data (without an abstract the page may need JavaScript),
+            or None if the GET failed
+        """
+        self._delay_per_robots()
+        html = fetch_html(publication_url)
+        if not html:
+            return None
+        return self.parser.parse_publication_detail(html, publication_url, basic_data)
+    
+    def _record_http_detail(self, served: bool):
+        """
+        Track whether static detail HTML had everything Selenium found.
+        
+        Args:
+            served: False when Selenium found an abstract the static HTML lacked; after
+                HTTP_DETAIL_MISS_LIMIT such pages in a row Selenium is used for every detail page
+        """
+        with self._http_detail_lock:
+            if served:
+                self._http_detail_misses = 0
+                return
+            self._http_detail_misses += 1
+            if self._http_detail_misses >= HTTP_DETAIL_MISS_LIMIT and self._http_detail:
+                logger.warning("Static detail pages keep missing content; using Selenium for detail pages from now on")
+                self._http_detail = False
+    
     def _ensure_robots_loaded(self):
-        """Fetch robots.txt via Selenium, parse and log content."""
+        """Fetch robots.txt via Selenium (again once ROBOTS_CACHE_TTL has passed), parse and log content."""
         try:
             if not RESPECT_ROBOTS:
                 return
             if not self.driver:
                 return
-            if self.robots._fetched and not self.robots._unavailable:
+            if self.robots._fetched and not self.robots._unavailable and not self.robots.is_stale():
                 return
-            # Always fetch via Selenium per requirement (once)
+            # Always fetch via Selenium per requirement (once); counts as a request to the site
+            self._delay_per_robots()
             logger.info("Fetching robots.txt via Selenium")
             content = fetch_text_via_selenium(self.driver, ROBOTS_URL)
             if not content:
@@ -552,68 +933,255 @@ class CoventryPublicationsCrawler:
                 self.robots._fetched = True
                 self.robots._unavailable = True
                 return
-            # Strip HTML if any and parse
-            import re
-            text = re.sub(r'<[^>]+>', '\n', content)
+            # Strip HTML if any (Chrome wraps plain text in <pre>) and parse
+            text = _HTML_TAG_RE.sub('\n', content) if '<' in content[:256] else content
             lines = [line.strip() for line in text.splitlines() if line.strip()]
-            from urllib import robotparser
-            self.robots.parser = robotparser.RobotFileParser()
-            self.robots.parser.parse(lines)
-            self.robots.parser.set_url(ROBOTS_URL)
-            self.robots._crawl_delay = self.robots.parser.crawl_delay(ROBOTS_USER_AGENT) or self.robots.parser.crawl_delay("*")
-            self.robots._fetched = True
-            self.robots._unavailable = False
+            self.robots.load(lines)
             # Log robots content (truncated)
             snippet = text if len(text) <= 2000 else text[:2000] + "\n... (truncated)"
-            logger.info(f"robots.txt content (via Selenium):\n{snippet}")
+            logger.info("robots.txt content (via Selenium):\n{}", snippet)
         except Exception as e:
-            logger.warning(f"Failed to load robots.txt via Selenium: {e}")
+            logger.warning("Failed to load robots.txt via Selenium: {}", e)
             self.robots._fetched = True
             self.robots._unavailable = True
     
+    def _record_skip(self, reason: str, page_number: Optional[int], index_on_page: int, title: str, publication_link: str):
+        """Count a skipped publication and append it to SKIPPED_FILE as one JSON line."""
+        record = {
+            "reason": reason,
+            "page_number": page_number,
+            "index_on_page": index_on_page,
+            "title": title,
+            "publication_link": publication_link
+        }
+        with self._skipped_lock:
+            self.skipped_count += 1
+            self.skipped_reasons[reason] += 1
+            if len(self.skipped_records) < SKIPPED_SAMPLE_SIZE:
+                self.skipped_records.append(record)
+            try:
+                if self._skipped_file is None:
+                    # The previous run's file was removed when crawling started
+                    self._skipped_file = open(SKIPPED_FILE, "a", encoding="utf-8")
+                self._skipped_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            except OSError as e:
+                logger.debug("Failed to write skipped record: {}", e)
+    
+    def _remove_skipped_file(self):
+        """Delete the previous run's SKIPPED_FILE so it is never mistaken for this run's output."""
+        with self._skipped_lock:
+            try:
+                os.remove(SKIPPED_FILE)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("Could not remove previous skipped records {}: {}", SKIPPED_FILE, e)
+    
+    def _close_skipped_file(self):
+        """Flush and close SKIPPED_FILE if any skipped record was written."""
+        with self._skipped_lock:
+            if self._skipped_file is not None:
+                self._skipped_file.close()
+                self._skipped_file = None
+    
+    def _handle_listing_page(self, publications: List[Dict[str, Any]], page_number: int):
+        """
+        Crawl details for a listing page's new publications and send them to the API.
+        
+        Args:
+            publications: Publications extracted from the listing page
+            page_number: 0-based index of the listing page
+        """
+        processed_publications = self.process_publications_with_details(publications, current_page_number=page_number)
+        if self._stopping.is_set():
+            logger.warning("Shutting down; publications from page {} were not saved or sent", page_number + 1)
+            return
+        
+        self.stats.add(processed_publications)
+        if self._csv_writer is not None:
+            self._csv_writer.write(processed_publications)
+        
+        # Send publications to API (page-batch) only if not in test single-post mode
+        if processed_publications and not API_POST_EACH_DETAIL:
+            _api_t0 = time.perf_counter()
+            api_success = send_to_api(processed_publications)
+            _api_t1 = time.perf_counter()
+            logger.info("API post time: {:.2f}s for {} records", _api_t1 - _api_t0, len(processed_publications))
+            if not api_success:
+                logger.warning("Failed to send publications from page {} to API; retrying in halves with logging", page_number + 1)
+                self._resend_in_halves(processed_publications, page_number, 1)
+    
+    def _resend_in_halves(self, publications: List[Dict[str, Any]], page_number: int, first_index: int):
+        """
+        Re-send a batch the API rejected, halving it until the failing records are isolated.
+        
+        A single bad record costs about 2*log2(n) requests instead of one per record;
+        records that still fail on their own are logged as skipped.
+        
+        Args:
+            publications: Records of the rejected batch
+            page_number: 0-based index of the listing page they came from
+            first_index: 1-based position of publications[0] on that page
+        """
+        if self._stopping.is_set():
+            return
+        if not api_available():
+            # The API is down or throttling: skip without bisecting (re-crawled next run)
+            for offset, pub in enumerate(publications):
+                self._record_skip("api_unavailable", page_number, first_index + offset, pub.get('title', ''), pub.get('publication_link', '') or "")
+            return
+        
+        if len(publications) == 1:
+            pub = publications[0]
+            try:
+                if not send_single_to_api(pub):
+                    self._record_skip("api_send_failed", page_number, first_index, pub.get('title', ''), pub.get('publication_link', '') or "")
+            except Exception as e:
+                logger.debug("Per-item API send raised exception: {}", e)
+                self._record_skip("api_send_exception", page_number, first_index, pub.get('title', ''), pub.get('publication_link', '') or "")
+            return
+        
+        mid = len(publications) // 2
+        for offset, half in ((0, publications[:mid]), (mid, publications[mid:])):
+            # A one-record half goes straight to the per-item send above
+            if len(half) > 1:
+                try:
+                    if send_to_api(half):
+                        continue
+                except Exception as e:
+                    logger.debug("Partial batch API send raised exception: {}", e)
+            self._resend_in_halves(half, page_number, first_index + offset)
+    
+    def _api_flusher(self):
+        """
+        Post queued enhanced publications to the API (test mode).
+        
+        Publications arriving within API_FLUSH_INTERVAL of the first one are sent
+        together, up to API_BATCH_SIZE per request.
+        """
+        while True:
+            batch = [self._api_queue.get()]
+            deadline = time.monotonic() + API_FLUSH_INTERVAL
+            while len(batch) < API_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._api_queue.get(timeout=remaining))
+                except Empty:
+                    break
+            try:
+                self._post_api_batch(batch)
+            finally:
+                for _ in batch:
+                    self._api_queue.task_done()
+    
+    def _post_api_batch(self, batch: List[Dict[str, Any]]):
+        """Send one flusher batch; a failed batch is retried record by record."""
+        if len(batch) > 1:
+            try:
+                logger.info("Posting {} enhanced publications to API (test mode)...", len(batch))
+                _api_t0 = time.perf_counter()
+                sent = send_to_api(batch)
+                _api_t1 = time.perf_counter()
+                if sent:
+                    logger.info("Batch API post time: {:.2f}s for {} records", _api_t1 - _api_t0, len(batch))
+                    return
+                logger.warning("Batch API post failed; posting the publications one at a time")
+            except Exception as e:
+                logger.warning("Batch API post raised, posting the publications one at a time: {}", e)
+        for publication in batch:
+            title = publication.get('title', '')
+            try:
+                logger.info("Posting single enhanced publication to API (test mode)...")
+                _api_t0 = time.perf_counter()
+                send_single_to_api(publication)
+                _api_t1 = time.perf_counter()
+                logger.info("Single API post time: {:.2f}s for: {}", _api_t1 - _api_t0, title)
+            except Exception as e:
+                logger.warning("Failed to post single enhanced publication for '{}': {}", title, e)
+    
+    def _page_worker(self):
+        """Consume listing pages queued by crawl_all_pages until the None sentinel."""
+        while True:
+            item = self._page_queue.get()
+            if item is None:
+                return
+            publications, page_number = item
+            try:
+                self._handle_listing_page(publications, page_number)
+            except Exception as e:
+                logger.error(f"Error processing publications from page {page_number + 1}: {e}")
+    
+    def _start_page_pipeline(self):
+        """Start the page worker so detail crawling overlaps the next listing fetch."""
+        if PIPELINE_DEPTH <= 0:
+            return
+        self._page_thread = threading.Thread(target=self._page_worker, name="pages", daemon=True)
+        self._page_thread.start()
+    
+    def _finish_page_pipeline(self, wait: bool = True):
+        """
+        Stop the page worker, by default after it has processed every queued page.
+        
+        Args:
+            wait: When False (on interrupt) queued pages are dropped, the page in progress
+                is abandoned and the worker gets PIPELINE_STOP_TIMEOUT to return
+        """
+        if self._page_thread is None:
+            return
+        if not wait:
+            self._stopping.set()
+            # Drop pages that have not been started yet
+            while not self._page_queue.empty():
+                self._page_queue.get_nowait()
+        self._page_queue.put(None)
+        self._page_thread.join(None if wait else PIPELINE_STOP_TIMEOUT)
+        if self._page_thread.is_alive():
+            logger.warning("Page worker still busy after {}s; closing the drivers anyway", PIPELINE_STOP_TIMEOUT)
+        self._page_thread = None
+    
     def crawl_all_pages(self):
         """Crawl all publication pages starting from the seed URL."""
         try:
             logger.info("Starting to crawl all publication pages")
+            self._remove_skipped_file()
             
             # Start with seed URL
             current_url = self._normalize_query_url(SEED_URL)
             total_pages: Optional[int] = None
             total_pages_logged: bool = False
+            # Development runs reuse the page count detected earlier today
+            if self.save_csv_flag:
+                total_pages = load_cached_total_pages(SEED_URL)
+                if total_pages is not None:
+                    logger.info("Using cached total page count: {}", total_pages)
+                    total_pages_logged = True
             # One-time robots fetch
             self._ensure_robots_loaded()
+            self._start_page_pipeline()
             
             while current_url:
                 try:
-                    # Respect robots crawl-delay between page visits
-                    self._delay_per_robots()
+                    # Refresh robots rules that have outlived ROBOTS_CACHE_TTL (no-op otherwise)
+                    if self.robots.is_stale():
+                        with self._driver_lock:
+                            self._ensure_robots_loaded()
                     
-                    # Respect robots disallow for this URL
+                    # Respect robots disallow for this URL (before taking a crawl-delay slot)
                     if not self._respect_robots_or_skip(current_url):
-                        logger.warning(f"Skipping disallowed URL by robots: {current_url}")
+                        logger.warning("Skipping disallowed URL by robots: {}", current_url)
                         # If disallowed, increment page index deterministically to continue iteration
-                        try:
-                            from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-                            from src.utils import get_page_number_from_url
-                            idx = get_page_number_from_url(current_url)
-                            next_idx = idx + 1
-                            if total_pages is not None and next_idx >= total_pages:
-                                current_url = None
-                            else:
-                                parsed = urlparse(current_url)
-                                query = parse_qs(parsed.query)
-                                query['page'] = [str(next_idx)]
-                                new_query = urlencode({k: v[0] for k, v in query.items()})
-                                current_url = urlunparse(parsed._replace(query=new_query))
-                        except Exception:
-                            current_url = None
+                        current_url = _next_listing_url(current_url, total_pages)
                         self.current_page += 1
                         continue
                     
-                    # Navigate to current listing page
-                    # Always navigate using normalized URL
-                    current_url = self._normalize_query_url(current_url)
-                    if not self.navigate_to_page(current_url):
+                    # Respect robots crawl-delay between page visits
+                    self._delay_per_robots()
+                    
+                    # Navigate to current listing page (the seed URL was normalized above;
+                    # later URLs only change the page parameter)
+                    if not self.navigate_to_page(current_url, detect_total_pages=total_pages is None):
                         self.consecutive_errors += 1
                         logger.error(f"Failed to navigate to page {self.current_page + 1}")
                         
@@ -622,21 +1190,7 @@ class CoventryPublicationsCrawler:
                             break
                         
                         # Move to the next page deterministically without touching Selenium state
-                        try:
-                            from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-                            from src.utils import get_page_number_from_url
-                            idx = get_page_number_from_url(current_url)
-                            next_idx = idx + 1
-                            if total_pages is not None and next_idx >= total_pages:
-                                current_url = None
-                            else:
-                                parsed = urlparse(current_url)
-                                query = parse_qs(parsed.query)
-                                query['page'] = [str(next_idx)]
-                                new_query = urlencode({k: v[0] for k, v in query.items()})
-                                current_url = self._normalize_query_url(urlunparse(parsed._replace(query=new_query)))
-                        except Exception:
-                            current_url = None
+                        current_url = _next_listing_url(current_url, total_pages)
                         self.current_page += 1
                         continue
                     
@@ -644,86 +1198,29 @@ class CoventryPublicationsCrawler:
                     publications = self.extract_publications_from_page(current_url)
                     
                     if publications:
-                        # Process publications: check cache and crawl details for new ones
-                        processed_publications = self.process_publications_with_details(publications, current_page_number=self.current_page)
-                        
-                        # Optional: parallel post-processing of publication records (no extra network)
-                        if PARALLEL_PARSE and processed_publications:
-                            def _identity(pub):
-                                return pub
-                            try:
-                                with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as executor:
-                                    futures = [executor.submit(_identity, pub) for pub in processed_publications]
-                                    processed_publications = [f.result() for f in as_completed(futures)]
-                            except Exception as e:
-                                logger.debug(f"Parallel parse post-process failed, continuing sequentially: {e}")
-                        
-                        self.all_publications.extend(processed_publications)
-                        
-                        # Send publications to API (page-batch) only if not in test single-post mode
-                        if processed_publications and not API_POST_EACH_DETAIL:
-                            _api_t0 = _time.perf_counter()
-                            api_success = send_to_api(processed_publications)
-                            _api_t1 = _time.perf_counter()
-                            logger.info(f"API post time: {(_api_t1 - _api_t0):.2f}s for {len(processed_publications)} records")
-                            if not api_success:
-                                logger.warning(f"Failed to send publications from page {self.current_page + 1} to API; attempting per-item retry with logging")
-                                # Retry individually and log failures as skipped
-                                for idx, pub in enumerate(processed_publications, start=1):
-                                    try:
-                                        single_ok = send_single_to_api(pub)
-                                        if not single_ok:
-                                            self.skipped_records.append({
-                                                "reason": "api_send_failed",
-                                                "page_number": self.current_page,
-                                                "index_on_page": idx,
-                                                "title": pub.get('title', ''),
-                                                "publication_link": pub.get('publication_link', '') or ""
-                                            })
-                                    except Exception as e:
-                                        logger.debug(f"Per-item API send raised exception: {e}")
-                                        self.skipped_records.append({
-                                            "reason": "api_send_exception",
-                                            "page_number": self.current_page,
-                                            "index_on_page": idx,
-                                            "title": pub.get('title', ''),
-                                            "publication_link": pub.get('publication_link', '') or ""
-                                        })
+                        if self._page_thread is not None:
+                            # Details and API posting run on the page worker while the next listing loads
+                            self._page_queue.put((publications, self.current_page))
+                        else:
+                            self._handle_listing_page(publications, self.current_page)
                     
-                    # After finishing this page, determine total pages once (from DOM) and iterate deterministically
-                    try:
-                        if total_pages is None and self.driver is not None:
-                            page_source_for_pagination = self.driver.page_source
-                            detected_total = self.parser.get_total_pages(page_source_for_pagination)
-                            # Parser returns total pages in 1-indexed UI terms; convert to 0-indexed last index
-                            if detected_total and detected_total > 0:
-                                total_pages = detected_total  # keep as count
-                                if not total_pages_logged:
-                                    logger.info(f"Total pages detected on first crawl: {detected_total}")
-                                    total_pages_logged = True
-                                logger.info(f"Detected pagination range: first=0, last={detected_total - 1} (total {detected_total} pages)")
-                    except Exception as e:
-                        logger.debug(f"Failed to detect total pages: {e}")
+                    # Total pages are read once, by the parse that validated the first listing page
+                    if total_pages is None and self._current_total_pages:
+                        total_pages = self._current_total_pages  # keep as count (1-indexed UI terms)
+                        if not total_pages_logged:
+                            logger.info("Total pages detected on first crawl: {}", total_pages)
+                            total_pages_logged = True
+                        logger.info("Detected pagination range: first=0, last={} (total {} pages)", total_pages - 1, total_pages)
+                        if self.save_csv_flag:
+                            save_cached_total_pages(SEED_URL, total_pages)
 
                     # Compute next index and construct next URL
-                    try:
-                        from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-                        from src.utils import get_page_number_from_url
-                        current_index = get_page_number_from_url(current_url)
-                        next_index = current_index + 1
-                        if total_pages is not None and next_index >= total_pages:
-                            logger.info(f"Reached last page index {current_index}; stopping crawl")
-                            current_url = None
-                        else:
-                            parsed = urlparse(current_url)
-                            query = parse_qs(parsed.query)
-                            query['page'] = [str(next_index)]
-                            new_query = urlencode({k: v[0] for k, v in query.items()})
-                            current_url = self._normalize_query_url(urlunparse(parsed._replace(query=new_query)))
-                            logger.info(f"Advancing to page index {next_index}: {current_url}")
-                    except Exception as e:
-                        logger.warning(f"Failed to construct next page URL deterministically: {e}")
-                        current_url = None
+                    current_index = get_page_number_from_url(current_url)
+                    current_url = _next_listing_url(current_url, total_pages)
+                    if current_url is None:
+                        logger.info("Reached last page index {}; stopping crawl", current_index)
+                    else:
+                        logger.info("Advancing to page index {}: {}", current_index + 1, current_url)
                     self.current_page += 1
                     
                 except Exception as e:
@@ -735,155 +1232,125 @@ class CoventryPublicationsCrawler:
                         break
                     
                     # Try to continue with next page by incrementing page index
-                    try:
-                        from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-                        from src.utils import get_page_number_from_url
-                        idx = get_page_number_from_url(current_url) if current_url else self.current_page
-                        next_idx = idx + 1
-                        if total_pages is not None and next_idx >= total_pages:
-                            current_url = None
-                        else:
-                            parsed = urlparse(current_url) if current_url else urlparse(self._normalize_query_url(SEED_URL))
-                            query = parse_qs(parsed.query)
-                            query['page'] = [str(next_idx)]
-                            new_query = urlencode({k: v[0] for k, v in query.items()})
-                            current_url = self._normalize_query_url(urlunparse(parsed._replace(query=new_query)))
-                    except Exception:
-                        current_url = None
+                    if current_url:
+                        current_url = _next_listing_url(current_url, total_pages)
+                    elif total_pages is None or self.current_page + 1 < total_pages:
+                        current_url = _with_page_index(self._normalize_query_url(SEED_URL), self.current_page + 1)
                     self.current_page += 1
                     continue
             
-            logger.info(f"Crawling completed. Total pages crawled: {self.current_page}")
-            logger.info(f"Total publications extracted: {len(self.all_publications)}")
+            # Let the page worker finish the pages still queued, then wait for pending API posts
+            self._finish_page_pipeline()
+            self._api_queue.join()
+            
+            logger.info("Crawling completed. Total pages crawled: {}", self.current_page)
+            logger.info("Total publications extracted: {}", self.stats.total_publications)
             
         except Exception as e:
             logger.error(f"Error during crawling: {e}")
             raise
+        finally:
+            self._finish_page_pipeline(wait=False)
     
     def save_results(self):
         """Generate and log crawling statistics."""
         try:
-            # Generate and log statistics
-            stats = get_crawling_statistics(self.all_publications)
-            logger.info("Crawling Statistics:")
-            logger.info(f"  Total Publications: {stats['total_publications']}")
-            logger.info(f"  Unique Authors: {stats['unique_authors']}")
-            logger.info(f"  Year Range: {stats['year_range']}")
-            logger.info(f"  Pages Crawled: {stats['pages_crawled']}")
-            # Log skipped publications summary
-            try:
-                total_skipped = len(self.skipped_records)
-                logger.info(f"  Publications Skipped (not recorded): {total_skipped}")
-                if total_skipped > 0:
-                    logger.info("  Skipped Publications Detail (up to first 20 shown):")
-                    for rec in self.skipped_records[:20]:
-                        logger.info(f"    - Page {rec.get('page_number')} idx {rec.get('index_on_page')}: '{rec.get('title','')}' reason={rec.get('reason')} link={rec.get('publication_link','')}")
-                    # If there are more skipped, show a short summary count by reason
-                    if total_skipped > 20:
-                        reason_counts = {}
-                        for rec in self.skipped_records:
-                            reason = rec.get('reason', 'unknown')
-                            reason_counts[reason] = reason_counts.get(reason, 0) + 1
-                        logger.info("  Skipped counts by reason: " + ", ".join(f"{k}={v}" for k, v in reason_counts.items()))
-            except Exception:
-                logger.debug("Failed to render skipped publications summary")
-            
-            # Save to CSV in data directory only if dev flag is enabled
-            if self.save_csv_flag and self.all_publications:
-                output_file = Path(DATA_DIR) / "publications.csv"
-                create_backup_file(output_file)
-                save_to_csv(self.all_publications, output_file)
-                logger.info(f"CSV saved to: {output_file}")
+            # Generate statistics; the whole summary is logged as one record
+            stats = self.stats.summary()
+            lines = [
+                "Crawling Statistics:",
+                f"  Total Publications: {stats['total_publications']}",
+                f"  Unique Authors: {stats['unique_authors']}",
+                f"  Year Range: {stats['year_range']}",
+                f"  Pages Crawled: {stats['pages_crawled']}",
+            ]
+            # Skipped publications summary
+            total_skipped = self.skipped_count
+            lines.append(f"  Publications Skipped (not recorded): {total_skipped}")
+            if total_skipped > 0:
+                lines.append(f"  Skipped Publications Detail (up to first {SKIPPED_SAMPLE_SIZE} shown):")
+                lines.extend(
+                    f"    - Page {rec.get('page_number')} idx {rec.get('index_on_page')}: '{rec.get('title', '')}' "
+                    f"reason={rec.get('reason')} link={rec.get('publication_link', '')}"
+                    for rec in self.skipped_records
+                )
+                # If there are more skipped, show a short summary count by reason
+                if total_skipped > SKIPPED_SAMPLE_SIZE:
+                    lines.append("  Skipped counts by reason: " + ", ".join(f"{k}={v}" for k, v in self.skipped_reasons.items()))
+                lines.append(f"  All skipped publications: {SKIPPED_FILE}")
+            
+            # Rows were appended page by page (dev flag only)
+            if self._csv_writer is not None and self._csv_writer.rows_written:
+                lines.append(f"CSV saved to: {self._csv_writer.output_file}")
+            logger.info("{}", "\n".join(lines))
             
         except Exception as e:
-            logger.error(f"Error generating statistics: {e}")
+            logger.error("Error generating statistics: {}", e)
             raise
     
+    def _timed_setup_driver(self):
+        """Run setup_driver() under the "WebDriver setup" timer (called on the driver-setup thread)."""
+        with timed("WebDriver setup"):
+            self.setup_driver()
+    
+    def _timed_save_results(self):
+        """Run save_results() under the "Results saving" timer (called on the save thread)."""
+        with timed("Results saving"):
+            self.save_results()
+    
     def run(self):
         """Main method to run the complete crawling process."""
-        start_time = datetime.now()
-        start_timestamp = start_time.strftime("%Y-%m-%d %H:%M:%S")
+        start_perf = time.perf_counter()
+        start_timestamp = time.strftime(_TIMESTAMP_FORMAT)
         
         try:
-            logger.info("=" * 60)
+            logger.info(_BAR)
             logger.info("STARTING COVENTRY UNIVERSITY PUBLICATIONS CRAWLER")
-            logger.info("=" * 60)
-            logger.info(f"Start Time: {start_timestamp}")
+            logger.info(_BAR)
+            logger.info("Start Time: {}", start_timestamp)
             
-            # Initialize publication ID cache
-            logger.info("Initializing publication ID cache...")
-            cache_start = time.perf_counter()
-            fetch_existing_publication_ids()
-            cache_end = time.perf_counter()
-            logger.info(f"Cache initialization completed in {cache_end - cache_start:.2f} seconds")
+            # Resolve the portal's host in the background while the API cache loads
+            threading.Thread(target=resolve_host, args=(SEED_URL,), name="dns", daemon=True).start()
             
-            # Setup WebDriver
+            # Start Chrome while the publication ID cache loads (setup errors are re-raised here)
             logger.info("Setting up WebDriver...")
-            driver_start = time.perf_counter()
-            self.setup_driver()
-            driver_end = time.perf_counter()
-            logger.info(f"WebDriver setup completed in {driver_end - driver_start:.2f} seconds")
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="driver-setup") as starter:
+                starting = starter.submit(self._timed_setup_driver)
+                
+                logger.info("Initializing publication ID cache...")
+                with timed("Cache initialization"):
+                    fetch_existing_publication_ids()
+                
+                starting.result()
             
             # Crawl all pages
             logger.info("Starting page crawling...")
-            crawl_start = time.perf_counter()
-            self.crawl_all_pages()
-            crawl_end = time.perf_counter()
-            logger.info(f"Page crawling completed in {crawl_end - crawl_start:.2f} seconds")
+            with timed("Page crawling"):
+                self.crawl_all_pages()
             
-            # Save results
+            # Save results while Chrome shuts down (save errors are re-raised here)
             logger.info("Saving results...")
-            save_start = time.perf_counter()
-            self.save_results()
-            save_end = time.perf_counter()
-            logger.info(f"Results saving completed in {save_end - save_start:.2f} seconds")
-            
-            # Calculate total time
-            end_time = datetime.now()
-            end_timestamp = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            total_duration = end_time - start_time
-            
-            logger.info("=" * 60)
-            logger.info("CRAWLING PROCESS COMPLETED SUCCESSFULLY")
-            logger.info("=" * 60)
-            logger.info(f"End Time: {end_timestamp}")
-            logger.info(f"Total Duration: {total_duration}")
-            logger.info(f"Total Duration (seconds): {total_duration.total_seconds():.2f}")
-            
-            # Print summary to console
-            print(f"\n{'='*60}")
-            print(f"CRAWLING COMPLETED SUCCESSFULLY")
-            print(f"{'='*60}")
-            print(f"Start Time: {start_timestamp}")
-            print(f"End Time: {end_timestamp}")
-            print(f"Total Duration: {total_duration}")
-            print(f"Total Duration (seconds): {total_duration.total_seconds():.2f}")
-            print(f"{'='*60}")
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="save") as saver:
+                saving = saver.submit(self._timed_save_results)
+                self.close_driver()
+                saving.result()
             
-        except Exception as e:
-            end_time = datetime.now()
-            end_timestamp = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            total_duration = end_time - start_time
-            
-            logger.error("=" * 60)
-            logger.error("CRAWLING PROCESS FAILED")
-            logger.error("=" * 60)
-            logger.error(f"End Time: {end_timestamp}")
-            logger.error(f"Duration before failure: {total_duration}")
-            logger.error(f"Error: {e}")
-            logger.error("=" * 60)
-            
-            print(f"\n{'='*60}")
-            print(f"CRAWLING FAILED")
-            print(f"{'='*60}")
-            print(f"Start Time: {start_timestamp}")
-            print(f"End Time: {end_timestamp}")
-            print(f"Duration before failure: {total_duration}")
-            print(f"Error: {e}")
-            print(f"{'='*60}")
+            _report("CRAWLING PROCESS COMPLETED SUCCESSFULLY", start_timestamp, time.strftime(_TIMESTAMP_FORMAT),
+                    time.perf_counter() - start_perf)
             
+        except (KeyboardInterrupt, SystemExit):
+            # No banner on abort (main() prints its own); stop Chrome without waiting for detail crawls
+            logger.warning("Crawling interrupted after {:.2f}s", time.perf_counter() - start_perf)
+            self.close_driver(wait=False)
+            raise
+        
+        except Exception as e:
+            duration = time.perf_counter() - start_perf
+            # Records the traceback with the failure; main() does not print it again
+            logger.exception("Crawling failed after {:.2f}s", duration)
+            _report("CRAWLING PROCESS FAILED", start_timestamp, time.strftime(_TIMESTAMP_FORMAT), duration, err=e)
             raise
         
         finally:
-            # Always close the driver
+            # Always close the driver (no-op if already closed after crawling)
             self.close_driver()
@@ -2,13 +2,15 @@
 HTML parsing utilities for extracting publication data.
 """
 
-from typing import List, Dict, Any, Optional
+import re
+import time
+from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from loguru import logger
 
-from src.utils import clean_text, extract_year_from_text, format_authors, format_author_links, validate_url, get_page_number_from_url
-from config.settings import PUBLICATION_SELECTORS, BASE_URL
+from src.utils import detail_log, clean_text, extract_year_from_text, format_authors, format_author_links, validate_url, get_page_number_from_url
+from config.settings import PUBLICATION_SELECTORS, BASE_URL, LISTING_CONTAINER_CLASS
 
 
 class PublicationParser:
@@ -16,6 +18,7 @@ class PublicationParser:
     
     def __init__(self):
         self.selectors = PUBLICATION_SELECTORS
+        self._listing_strainer = SoupStrainer("div", class_=LISTING_CONTAINER_CLASS)
     
     def parse_publications_page(self, html_content: str, page_url: str) -> List[Dict[str, Any]]:
         """
@@ -28,11 +31,35 @@ class PublicationParser:
         Returns:
             List of publication dictionaries
         """
+        # Only build the result containers; headers, facets and footers are skipped
+        soup = BeautifulSoup(html_content, 'html.parser', parse_only=self._listing_strainer)
+        return self._parse_publication_containers(soup, page_url)
+    
+    def scan_listing(self, html_content: str, page_url: str, with_total_pages: bool = False) -> Tuple[bool, List[Dict[str, Any]], Optional[int]]:
+        """
+        Validate a listing page and extract its publications from a single parse.
+        
+        Args:
+            html_content: Raw HTML content of the page
+            page_url: URL of the page being parsed
+            with_total_pages: Also read the total page count from the pagination
+            
+        Returns:
+            (is valid listing page, publications, total pages or None)
+        """
         soup = BeautifulSoup(html_content, 'html.parser')
+        if not self._is_listing_page(soup):
+            return False, [], None
+        publications = self._parse_publication_containers(soup, page_url)
+        total_pages = self._total_pages_from_soup(soup) if with_total_pages else None
+        return True, publications, total_pages
+    
+    def _parse_publication_containers(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+        """Extract publication data from every result container in a parsed listing page."""
         publications: List[Dict[str, Any]] = []
         
         # Find all publication containers
-        publication_containers = soup.select(self.selectors["publication_container"])
+        publication_containers = self.selectors["publication_container"].select(soup)
         
         if not publication_containers:
             logger.warning(f"No publication containers found on page: {page_url}")
@@ -71,7 +98,7 @@ class PublicationParser:
         """
         try:
             # Extract title and publication link
-            title_element = container.select_one(self.selectors["title"]) 
+            title_element = self.selectors["title"].select_one(container)
             publication_link = ""
             if title_element:
                 title = clean_text(title_element.get_text())
@@ -96,7 +123,7 @@ class PublicationParser:
             author_links = []
             
             # First, try to find author elements
-            author_elements = container.select(self.selectors["authors"])
+            author_elements = self.selectors["authors"].select(container)
             for author_elem in author_elements:
                 author_name = clean_text(author_elem.get_text())
                 if author_name and author_name not in authors:
@@ -110,7 +137,7 @@ class PublicationParser:
                     author_link = author_elem.get('href', '')
                 else:
                     # Look for nested link elements
-                    author_link_elem = author_elem.select_one(self.selectors["author_link"])
+                    author_link_elem = self.selectors["author_link"].select_one(author_elem)
                     if author_link_elem:
                         author_link = author_link_elem.get('href', '')
                 
@@ -126,8 +153,6 @@ class PublicationParser:
                     container_text = container.get_text()
                     
                     # Simple approach: look for text before the first date
-                    import re
-                    
                     # Find the first date in the text
                     date_pattern = r'\d{1,2}\s+\w+\s+\d{4}'
                     date_match = re.search(date_pattern, container_text)
@@ -150,11 +175,11 @@ class PublicationParser:
                                 authors = potential_authors
                                 
                 except Exception as e:
-                    logger.debug(f"Error extracting authors from text: {e}")
+                    logger.debug("Error extracting authors from text: {}", e)
                     authors = []
             
             # Extract year
-            year_element = container.select_one(self.selectors["year"])
+            year_element = self.selectors["year"].select_one(container)
             year = ""
             if year_element:
                 year_text = clean_text(year_element.get_text())
@@ -163,7 +188,6 @@ class PublicationParser:
             # If no year found in element, try to extract from text content
             if not year:
                 container_text = container.get_text()
-                import re
                 # Look for date patterns like "11 Feb 2025"
                 date_pattern = r'\d{1,2}\s+\w+\s+(\d{4})'
                 match = re.search(date_pattern, container_text)
@@ -185,7 +209,7 @@ class PublicationParser:
                     else:
                         logger.warning(f"Publication has non-numeric year '{year}'; coercing to 0")
             except Exception as e:
-                logger.debug(f"Year parse error '{year}': {e}; coercing to 0")
+                logger.debug("Year parse error '{}': {}; coercing to 0", year, e)
             
             # Do not drop the record if publication_link is missing/invalid; keep basic data
             if not publication_link or not publication_link.startswith('http'):
@@ -213,25 +237,14 @@ class PublicationParser:
             logger.error(f"Error extracting publication data: {e}")
             return None
     
-    def get_total_pages(self, html_content: str) -> int:
-        """
-        Extract total number of pages from pagination.
-        
-        Args:
-            html_content: Raw HTML content of the page
-            
-        Returns:
-            Total number of pages
-        """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
+    def _total_pages_from_soup(self, soup: BeautifulSoup) -> int:
+        """Read the total page count from a parsed listing page's pagination."""
         # Look for pagination in navigation elements
         nav_elements = soup.find_all('nav')
         for nav in nav_elements:
             nav_text = nav.get_text().strip()
             if 'Next' in nav_text:
                 # Look for the highest page number in the navigation
-                import re
                 # Look for patterns like "12345678910..16Next ›"
                 # Extract the last number before "Next"
                 match = re.search(r'(\d+)\.\.(\d+).*Next', nav_text)
@@ -268,7 +281,6 @@ class PublicationParser:
             try:
                 href = elem.get('href', '')
                 if 'page=' in href:
-                    import re
                     match = re.search(r'page=(\d+)', href)
                     if match:
                         page_numbers.append(int(match.group(1)))
@@ -345,9 +357,12 @@ class PublicationParser:
             True if page appears to be a valid publications page
         """
         soup = BeautifulSoup(html_content, 'html.parser')
-        
+        return self._is_listing_page(soup)
+    
+    def _is_listing_page(self, soup: BeautifulSoup) -> bool:
+        """Check a parsed page for results, pagination or a "no results" message."""
         # Check for publication containers
-        publication_containers = soup.select(self.selectors["publication_container"])
+        publication_containers = self.selectors["publication_container"].select(soup)
         if publication_containers:
             return True
         
@@ -377,20 +392,18 @@ class PublicationParser:
         Returns:
             Enhanced publication data with abstract and detailed authors
         """
-        import time
-        
         title = basic_data.get('title', 'Unknown')
         parse_start_time = time.perf_counter()
         
         try:
-            logger.info(f"Parsing detail page for: {title}")
+            detail_log("Parsing detail page for: {}", title)
             soup = BeautifulSoup(html_content, 'html.parser')
             
             # Start with the basic data
             enhanced_data = basic_data.copy()
             
             # Extract abstract
-            logger.info("Extracting abstract from detail page...")
+            detail_log("Extracting abstract from detail page...")
             abstract_start_time = time.perf_counter()
             abstract = self._extract_abstract(soup)
             abstract_end_time = time.perf_counter()
@@ -398,14 +411,17 @@ class PublicationParser:
             
             if abstract:
                 enhanced_data["abstract"] = abstract
-                logger.info(f"Abstract extracted successfully in {abstract_extract_time:.3f}s ({len(abstract)} characters)")
-                logger.debug(f"Abstract preview: {abstract[:100]}..." if len(abstract) > 100 else f"Abstract: {abstract}")
+                detail_log("Abstract extracted successfully in {:.3f}s ({} characters)", abstract_extract_time, len(abstract))
+                if len(abstract) > 100:
+                    logger.debug("Abstract preview: {}...", abstract[:100])
+                else:
+                    logger.debug("Abstract: {}", abstract)
             else:
                 enhanced_data["abstract"] = ""
                 logger.warning(f"No abstract found in detail page (search took {abstract_extract_time:.3f}s)")
             
             # Extract detailed authors (replace the basic authors)
-            logger.info("Extracting detailed authors from detail page...")
+            detail_log("Extracting detailed authors from detail page...")
             authors_start_time = time.perf_counter()
             detailed_authors, detailed_author_links = self._extract_detailed_authors(soup)
             authors_end_time = time.perf_counter()
@@ -414,17 +430,17 @@ class PublicationParser:
             if detailed_authors:
                 enhanced_data["authors"] = format_authors(detailed_authors)
                 enhanced_data["author_links"] = format_author_links(detailed_author_links)
-                logger.info(f"Detailed authors extracted successfully in {authors_extract_time:.3f}s")
-                logger.info(f"Found {len(detailed_authors)} authors: {', '.join(detailed_authors[:3])}{'...' if len(detailed_authors) > 3 else ''}")
-                logger.info(f"Author links found: {len(detailed_author_links)}")
+                detail_log("Detailed authors extracted successfully in {:.3f}s", authors_extract_time)
+                detail_log("Found {} authors: {}{}", len(detailed_authors), ', '.join(detailed_authors[:3]), '...' if len(detailed_authors) > 3 else '')
+                detail_log("Author links found: {}", len(detailed_author_links))
             else:
-                logger.info(f"No detailed authors found, keeping original authors (search took {authors_extract_time:.3f}s)")
+                detail_log("No detailed authors found, keeping original authors (search took {:.3f}s)", authors_extract_time)
             
             parse_end_time = time.perf_counter()
             total_parse_time = parse_end_time - parse_start_time
             
-            logger.info(f"Detail page parsing completed in {total_parse_time:.3f}s total")
-            logger.info(f"Enhanced data summary - Abstract: {'✓' if enhanced_data.get('abstract') else '✗'}, Authors: {enhanced_data.get('authors', 'N/A')}")
+            detail_log("Detail page parsing completed in {:.3f}s total", total_parse_time)
+            detail_log("Enhanced data summary - Abstract: {}, Authors: {}", '✓' if enhanced_data.get('abstract') else '✗', enhanced_data.get('authors', 'N/A'))
             
             return enhanced_data
             
@@ -471,11 +487,11 @@ class PublicationParser:
                         # Check for common abstract indicators
                         text_lower = text.lower()
                         if any(indicator in text_lower for indicator in ['abstract', 'summary', 'background', 'objective', 'method', 'result', 'conclusion']):
-                            logger.info(f"Found abstract using selector: {selector} (with keywords)")
+                            detail_log("Found abstract using selector: {} (with keywords)", selector)
                             return text
                         # If text is long enough, it might be an abstract without explicit markers
                         elif len(text) > 100:
-                            logger.info(f"Found potential abstract using selector: {selector} (by length)")
+                            detail_log("Found potential abstract using selector: {} (by length)", selector)
                             return text
             
             # Fallback: look for any substantial text block that might be an abstract
@@ -530,7 +546,7 @@ class PublicationParser:
             for selector in author_selectors:
                 author_elements = soup.select(selector)
                 if author_elements:
-                    logger.info(f"Found {len(author_elements)} author elements using selector: {selector}")
+                    detail_log("Found {} author elements using selector: {}", len(author_elements), selector)
                     for author_elem in author_elements:
                         author_name = clean_text(author_elem.get_text())
                         if author_name and author_name not in authors:
@@ -580,7 +596,7 @@ class PublicationParser:
                     if authors:
                         break
             
-            logger.debug(f"Extracted {len(authors)} detailed authors")
+            logger.debug("Extracted {} detailed authors", len(authors))
             return authors, author_links
             
         except Exception as e:
@@ -2,24 +2,92 @@
 Utility functions for the crawler.
 """
 
+import base64
+import csv
+import gzip
+import json
+import os
+import re
+import socket
+import threading
 import time
+import pickle
 import requests
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import date
 from pathlib import Path
-from typing import List, Dict, Any
+from urllib import robotparser
+from urllib.parse import urlsplit, urlparse, urlunparse, quote, unquote
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
-import pandas as pd
 import sys
 
-from config.settings import LOG_FILE, LOG_FORMAT, LOG_LEVEL, CSV_ENCODING, CSV_DELIMITER, API_ENDPOINT, API_IDS_ENDPOINT, API_TIMEOUT, API_RETRIES, API_POST_EACH_DETAIL
+try:
+    import orjson  # optional: faster encoding of API payloads
+except ImportError:
+    orjson = None
+
+from config.settings import LOG_DIR, DATA_DIR, LOG_FILE, LOG_FORMAT, LOG_LEVEL, LOG_FILE_BUFFERING, CSV_ENCODING, CSV_DELIMITER, CSV_WRITE_BUFFER, CSV_COLUMNS, DETAIL_LOG_VERBOSE, API_ENDPOINT, API_IDS_ENDPOINT, API_TIMEOUT, API_RETRIES, API_POST_EACH_DETAIL, API_HEADERS
+from config.settings import CACHE_DIR, PAGINATION_CACHE, DRIVER_PATH_CACHE, PUBLICATION_IDS_CACHE, PUBLICATION_IDS_CACHE_TTL, PAGINATION_CACHE_TTL, DEFAULT_HEADERS, TIMEOUT
+from config.settings import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_CONNECT_RETRIES, API_GZIP_POSTS, API_GZIP_MIN_BYTES
+from config.settings import API_BREAKER_THRESHOLD, API_BREAKER_COOLDOWN, API_BREAKER_MAX_COOLDOWN
+from config.settings import RESPECT_ROBOTS, ROBOTS_URL, ROBOTS_USER_AGENT, ROBOTS_FALLBACK_CRAWL_DELAY, ROBOTS_CACHE_TTL
+
+def _build_session() -> requests.Session:
+    """Create the shared HTTP session with a connection pool sized for the crawler's threads."""
+    session = requests.Session()
+    # Only connection failures are retried here: nothing reached the server, so no crawl-delay
+    # or duplicate-POST concerns. Status and read errors stay with the callers' own retry loops.
+    retries = Retry(total=HTTP_CONNECT_RETRIES, connect=HTTP_CONNECT_RETRIES, read=0, status=0, other=0, backoff_factor=0.3)
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+# Shared HTTP session so API and page requests reuse pooled keep-alive connections
+_SESSION = _build_session()
+
+
+def _encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize an API payload to UTF-8 JSON bytes (with orjson when it is installed)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+_GZIP_API_HEADERS = {**API_HEADERS, "Content-Encoding": "gzip"}
+
+
+def _prepare_body(body: bytes) -> Tuple[bytes, Dict[str, str]]:
+    """Return the request body and headers to post it with, gzipped when API_GZIP_POSTS applies."""
+    if API_GZIP_POSTS and len(body) >= API_GZIP_MIN_BYTES:
+        # Level 1: most of the size reduction on repetitive JSON for little CPU
+        return gzip.compress(body, compresslevel=1), _GZIP_API_HEADERS
+    return body, API_HEADERS
+
 
 # Global cache for existing publication IDs
 _existing_publication_ids: set = set()
 _cache_initialized: bool = False
+# Guards additions to the ID set (API sends happen on worker threads)
+_ids_cache_lock = threading.Lock()
+# Set when sent publications were added since the on-disk copy was written
+_ids_cache_dirty: bool = False
+# time.time() of the API fetch the ID set is based on (kept across cache loads); None when
+# the fetch failed, in which case the set is incomplete and is never written to disk
+_ids_fetched_at: Optional[float] = None
+
+# Whether setup_logging() has already attached the sinks
+_logging_configured: bool = False
 
 
 def encode_title_to_base64(title: str) -> str:
     """Convert publication title to base64 encoded string."""
-    import base64
     if not title:
         return ""
     # Encode title to bytes, then to base64
@@ -30,29 +98,35 @@ def encode_title_to_base64(title: str) -> str:
 
 def fetch_existing_publication_ids() -> set:
     """Fetch all existing publication IDs from the API and cache them."""
-    global _existing_publication_ids, _cache_initialized
+    global _existing_publication_ids, _cache_initialized, _ids_fetched_at
     
     if _cache_initialized:
         return _existing_publication_ids
     
+    cached = _load_cached_publication_ids()
+    if cached is not None:
+        _existing_publication_ids, _ids_fetched_at = cached
+        _cache_initialized = True
+        logger.info(f"Loaded {len(_existing_publication_ids)} existing publication IDs from local cache")
+        return _existing_publication_ids
+    
     try:
         logger.info("Fetching existing publication IDs from API...")
         
-        response = requests.get(
+        response = _SESSION.get(
             API_IDS_ENDPOINT,
             timeout=API_TIMEOUT,
-            headers={
-                'Content-Type': 'application/json',
-                'User-Agent': 'Coventry-Crawler/1.0'
-            }
+            headers=API_HEADERS
         )
         
         if response.status_code == 200:
             data = response.json()
             ids = data.get('ids', [])
             _existing_publication_ids = set(ids)
+            _ids_fetched_at = time.time()
             _cache_initialized = True
             logger.info(f"Successfully cached {len(_existing_publication_ids)} existing publication IDs")
+            _save_cached_publication_ids()
             return _existing_publication_ids
         else:
             logger.warning(f"Failed to fetch publication IDs. Status code: {response.status_code}")
@@ -84,6 +158,68 @@ def is_publication_exists(title: str) -> bool:
     return encoded_title in _existing_publication_ids
 
 
+def _load_cached_publication_ids() -> Optional[Tuple[set, float]]:
+    """
+    Return the publication IDs saved by a recent run against the same API, if still fresh.
+    
+    Returns:
+        (IDs, time.time() of the API fetch they came from), or None
+    """
+    try:
+        with PUBLICATION_IDS_CACHE.open("rb") as f:
+            cached = pickle.load(f)
+        if cached.get("endpoint") != API_IDS_ENDPOINT:
+            return None
+        # Measured from the API fetch, not the file time: later runs rewrite the file with their sends
+        fetched_at = cached.get("fetched_at")
+        if fetched_at is None or time.time() - fetched_at > PUBLICATION_IDS_CACHE_TTL:
+            return None
+        return cached["ids"], fetched_at
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable publication ID cache: {e}")
+        return None
+
+
+def _save_cached_publication_ids():
+    """Persist the current publication ID set for the next run (only if it came from a successful API fetch)."""
+    if _ids_fetched_at is None:
+        return
+    try:
+        with _ids_cache_lock:
+            ids = set(_existing_publication_ids)
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Written beside the cache and swapped in, so an interrupted write never leaves a truncated pickle
+        tmp_path = PUBLICATION_IDS_CACHE.with_suffix(".tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump({"endpoint": API_IDS_ENDPOINT, "fetched_at": _ids_fetched_at, "ids": ids}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, PUBLICATION_IDS_CACHE)
+    except Exception as e:
+        logger.debug(f"Failed to write publication ID cache: {e}")
+
+
+def mark_publications_existing(publications: List[Dict[str, Any]]) -> None:
+    """Add successfully sent publications to the existing-ID cache so repeats are skipped."""
+    global _ids_cache_dirty
+    with _ids_cache_lock:
+        for publication in publications:
+            title = publication.get('title', '')
+            if title:
+                _existing_publication_ids.add(encode_title_to_base64(title))
+        _ids_cache_dirty = True
+
+
+def save_publication_ids_cache():
+    """Write the IDs of publications sent this run to the on-disk cache (called once, at shutdown)."""
+    global _ids_cache_dirty
+    # So a run started within the TTL does not resend them
+    if not (_cache_initialized and _ids_cache_dirty):
+        return
+    _ids_cache_dirty = False
+    _save_cached_publication_ids()
+
+
 def filter_existing_publications(publications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Filter out publications that already exist in the database."""
     if not publications:
@@ -110,8 +246,23 @@ def filter_existing_publications(publications: List[Dict[str, Any]]) -> List[Dic
     return new_publications
 
 
+def ensure_output_dirs():
+    """Create the log and data directories if they do not exist yet."""
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+
 def setup_logging():
-    """Setup logging configuration."""
+    """Setup logging configuration (idempotent; later calls are no-ops)."""
+    global _logging_configured
+    
+    if _logging_configured:
+        return
+    _logging_configured = True
+    
+    # Output directories are created here rather than at settings import time
+    ensure_output_dirs()
+    
     # Remove default handler
     logger.remove()
     
@@ -122,7 +273,11 @@ def setup_logging():
         level=LOG_LEVEL,
         rotation="10 MB",
         retention="30 days",
-        compression="zip"
+        compression="zip",
+        enqueue=False,  # write synchronously; no background queue thread
+        # Batch writes instead of one write() per line; loguru flushes the file
+        # when the sink is removed at interpreter exit
+        buffering=LOG_FILE_BUFFERING
     )
     
     # Add console handler
@@ -137,12 +292,131 @@ def setup_logging():
     logger.add(_safe_print, format=LOG_FORMAT, level=LOG_LEVEL)
 
 
+# Per-publication progress lines (crawler and parser); at DEBUG, skipped before formatting,
+# unless DETAIL_LOG_VERBOSE
+detail_log = logger.info if DETAIL_LOG_VERBOSE else logger.debug
+
+
+def resolve_host(url: str):
+    """Resolve the host of url ahead of the first request so the DNS lookup is already cached."""
+    parts = urlsplit(url)
+    try:
+        _t0 = time.perf_counter()
+        socket.getaddrinfo(parts.hostname, parts.port or (443 if parts.scheme == "https" else 80), type=socket.SOCK_STREAM)
+        logger.debug(f"Resolved {parts.hostname} in {time.perf_counter() - _t0:.3f}s")
+    except OSError as e:
+        logger.debug(f"Could not pre-resolve {parts.hostname}: {e}")
+
+
+def fetch_html(url: str) -> Optional[str]:
+    """Fetch a page over plain HTTP with the shared session; returns None on failure."""
+    try:
+        response = _SESSION.get(url, headers=DEFAULT_HEADERS, timeout=TIMEOUT)
+        if response.status_code == 200:
+            return response.text
+        logger.warning(f"HTTP fetch returned status code {response.status_code} for {url}")
+    except requests.exceptions.Timeout:
+        logger.warning(f"HTTP fetch timeout for {url}")
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"HTTP fetch failed for {url}: {e}")
+    return None
+
+
+@contextmanager
+def timed(label: str):
+    """Log how long the enclosed block took as "<label> completed in N.NN seconds"."""
+    start = time.perf_counter()
+    yield
+    logger.info("{} completed in {:.2f} seconds", label, time.perf_counter() - start)
+
+
 def delay(seconds: float):
     """Add delay between requests to be polite to the server."""
     logger.debug(f"Delaying for {seconds} seconds")
     time.sleep(seconds)
 
 
+class ApiCircuitBreaker:
+    """Back-off state shared by every API send (page worker and test-mode flusher)."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._cooldown = API_BREAKER_COOLDOWN
+        self._open_until = 0.0
+        self._paused_until = 0.0
+    
+    def allow(self) -> bool:
+        """Return False while the circuit is open (sends should fail fast)."""
+        return time.monotonic() >= self._open_until
+    
+    def wait(self, minimum: float = 0.0):
+        """Sleep for at least minimum seconds, or until a server-requested pause is over."""
+        pause = max(minimum, self._paused_until - time.monotonic())
+        if pause > 0:
+            time.sleep(pause)
+    
+    def throttle(self, retry_after: Optional[str], attempt: int) -> float:
+        """
+        Pause all sends after a 429/503 response.
+        
+        Args:
+            retry_after: Retry-After header value (seconds or HTTP date), if any
+            attempt: 0-based attempt number, for the exponential fallback
+        
+        Returns:
+            Length of the pause in seconds
+        """
+        pause = _retry_after_seconds(retry_after)
+        if pause is None:
+            pause = 5 * (2 ** attempt)
+        pause = min(pause, API_BREAKER_MAX_COOLDOWN)
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+        return pause
+    
+    def record(self, success: bool):
+        """
+        Count a finished send; opens the circuit after API_BREAKER_THRESHOLD failures in a row.
+        
+        Only failures pointing at the server (timeouts, connection errors, 429 and 5xx)
+        should be recorded, so a batch rejected for its content does not stop the others.
+        """
+        with self._lock:
+            if success:
+                self._failures = 0
+                self._cooldown = API_BREAKER_COOLDOWN
+                return
+            self._failures += 1
+            if self._failures < API_BREAKER_THRESHOLD:
+                return
+            # Also reached by each trial send after a cooldown that fails again
+            self._open_until = time.monotonic() + self._cooldown
+            logger.warning("{} API sends failed in a row; not sending for {}s", self._failures, self._cooldown)
+            self._cooldown = min(self._cooldown * 2, API_BREAKER_MAX_COOLDOWN)
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds from now."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+_api_breaker = ApiCircuitBreaker()
+
+
+def api_available() -> bool:
+    """Whether API sends are currently attempted (False while the circuit breaker is open)."""
+    return _api_breaker.allow()
+
+
 def send_to_api(data: List[Dict[str, Any]]) -> bool:
     """Send extracted data to API endpoint (excluding page_number field)."""
     if not data:
@@ -165,26 +439,43 @@ def send_to_api(data: List[Dict[str, Any]]) -> bool:
     payload = {
         "publications": publications
     }
+    # Encoded once and reused by every attempt
+    try:
+        body = _encode_payload(payload)
+    except (TypeError, ValueError) as e:
+        logger.error(f"Could not serialize publications for the API: {e}")
+        return False
+    body, headers = _prepare_body(body)
+    
+    if not _api_breaker.allow():
+        logger.warning("API circuit open; not sending {} publications", len(publications))
+        return False
     
     for attempt in range(API_RETRIES):
+        _api_breaker.wait()
         try:
             logger.info(f"Sending {len(publications)} publications to API (attempt {attempt + 1}/{API_RETRIES})")
             
-            response = requests.post(
+            response = _SESSION.post(
                 API_ENDPOINT,
-                json=payload,
+                data=body,
                 timeout=API_TIMEOUT,
-                headers={
-                    'Content-Type': 'application/json',
-                    'User-Agent': 'Coventry-Crawler/1.0'
-                }
+                headers=headers
             )
             
             if response.status_code == 200:
                 logger.info(f"Successfully sent {len(publications)} publications to API")
+                _api_breaker.record(True)
+                mark_publications_existing(publications)
                 return True
+            elif response.status_code in (429, 503):
+                pause = _api_breaker.throttle(response.headers.get("Retry-After"), attempt)
+                logger.warning("API returned status code {}; pausing API sends for {:.0f}s", response.status_code, pause)
             else:
                 logger.warning(f"API returned status code {response.status_code}: {response.text}")
+                if response.status_code < 500:
+                    # The request itself was rejected: retrying the same body cannot succeed
+                    return False
                 
         except requests.exceptions.Timeout:
             logger.error(f"API request timeout on attempt {attempt + 1}")
@@ -195,9 +486,10 @@ def send_to_api(data: List[Dict[str, Any]]) -> bool:
         
         if attempt < API_RETRIES - 1:
             logger.info(f"Retrying API call in 5 seconds...")
-            time.sleep(5)
+            _api_breaker.wait(5)
     
     logger.error(f"Failed to send data to API after {API_RETRIES} attempts")
+    _api_breaker.record(False)
     return False
 
 
@@ -214,31 +506,43 @@ def send_single_to_api(publication: Dict[str, Any]) -> bool:
 
     normalized = _normalize_publication_for_api(filtered)
     payload = {"publications": [normalized]}
+    try:
+        body = _encode_payload(payload)
+    except (TypeError, ValueError) as e:
+        logger.error(f"Could not serialize publication for the API: {e}")
+        return False
 
     # Log payload being sent for test visibility
-    try:
-        import json
-        logger.info(f"POST payload preview: {json.dumps(payload, ensure_ascii=False)[:1500]}" )
-    except Exception:
-        logger.debug("Failed to serialize payload preview for logging")
+    logger.info("POST payload preview: {}", body[:1500].decode("utf-8", "ignore"))
+    body, headers = _prepare_body(body)
+
+    if not _api_breaker.allow():
+        logger.warning("API circuit open; not sending single publication")
+        return False
 
     for attempt in range(API_RETRIES):
+        _api_breaker.wait()
         try:
             logger.info(f"Sending single publication to API (attempt {attempt + 1}/{API_RETRIES})")
-            response = requests.post(
+            response = _SESSION.post(
                 API_ENDPOINT,
-                json=payload,
+                data=body,
                 timeout=API_TIMEOUT,
-                headers={
-                    'Content-Type': 'application/json',
-                    'User-Agent': 'Coventry-Crawler/1.0'
-                }
+                headers=headers
             )
             if response.status_code == 200:
                 logger.info("Successfully sent single publication to API")
+                _api_breaker.record(True)
+                mark_publications_existing([normalized])
                 return True
+            elif response.status_code in (429, 503):
+                pause = _api_breaker.throttle(response.headers.get("Retry-After"), attempt)
+                logger.warning("API returned status code {}; pausing API sends for {:.0f}s", response.status_code, pause)
             else:
                 logger.warning(f"API returned status code {response.status_code}: {response.text}")
+                if response.status_code < 500:
+                    # The request itself was rejected: retrying the same body cannot succeed
+                    return False
         except requests.exceptions.Timeout:
             logger.error(f"API request timeout on attempt {attempt + 1}")
         except requests.exceptions.ConnectionError:
@@ -248,9 +552,10 @@ def send_single_to_api(publication: Dict[str, Any]) -> bool:
 
         if attempt < API_RETRIES - 1:
             logger.info("Retrying API call in 5 seconds...")
-            time.sleep(5)
+            _api_breaker.wait(5)
 
     logger.error("Failed to send single publication to API after retries")
+    _api_breaker.record(False)
     return False
 
 
@@ -280,29 +585,59 @@ def _normalize_publication_for_api(publication: Dict[str, Any]) -> Dict[str, Any
     return normalized
 
 
-def save_to_csv(data: List[Dict[str, Any]], output_file: Path):
-    """Save extracted data to CSV file (fallback method)."""
-    if not data:
-        logger.warning("No data to save")
-        return
+class PublicationCsvWriter:
+    """Write publications to a CSV file page by page through one open, buffered handle."""
+    def __init__(self, output_file: Path):
+        self.output_file = output_file
+        self.rows_written = 0
+        self._handle = None
+        self._writer = None
+        # Pages are written by the page worker while the main thread may close the file
+        self._lock = threading.Lock()
     
-    try:
-        # Create DataFrame
-        df = pd.DataFrame(data)
-        
-        # Save to CSV
-        df.to_csv(
-            output_file,
-            index=False,
-            encoding=CSV_ENCODING,
-            sep=CSV_DELIMITER
-        )
+    def write(self, data: List[Dict[str, Any]]):
+        """Append publications, backing up the previous file and writing the header on the first call."""
+        if not data:
+            return
+        with self._lock:
+            if self._writer is None:
+                self._open()
+            self._writer.writerows(data)
+            # Flush per page so the file is complete up to the last finished page
+            self._handle.flush()
+            self.rows_written += len(data)
+        logger.info(f"Saved {len(data)} publications to {self.output_file}")
+    
+    def _open(self):
+        """Open the file: fresh (after a backup) the first time, for appending if closed since."""
+        first = self.rows_written == 0
+        if first:
+            create_backup_file(self.output_file)
         
-        logger.info(f"Saved {len(data)} publications to {output_file}")
+        def _open_file():
+            # One large buffer so each page is written in a few big chunks
+            return open(self.output_file, "w" if first else "a", encoding=CSV_ENCODING, newline="", buffering=CSV_WRITE_BUFFER)
         
-    except Exception as e:
-        logger.error(f"Error saving data to CSV: {e}")
-        raise
+        try:
+            self._handle = _open_file()
+        except OSError:
+            # Directories are created lazily: only pay for mkdir when the first open fails
+            if self.output_file.parent.exists():
+                raise
+            ensure_output_dirs()
+            self._handle = _open_file()
+        self._writer = csv.DictWriter(self._handle, fieldnames=CSV_COLUMNS, delimiter=CSV_DELIMITER,
+                                      extrasaction="ignore", lineterminator="\n")
+        if first:
+            self._writer.writeheader()
+    
+    def close(self):
+        """Close the file if it is open."""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+                self._writer = None
 
 
 def clean_text(text: str) -> str:
@@ -320,7 +655,6 @@ def extract_year_from_text(text: str) -> str:
     if not text:
         return ""
     
-    import re
     # Look for 4-digit year pattern
     year_match = re.search(r'\b(19|20)\d{2}\b', text)
     if year_match:
@@ -338,7 +672,6 @@ def validate_url(url: str) -> bool:
 
 def get_page_number_from_url(url: str) -> int:
     """Extract page number from URL."""
-    import re
     match = re.search(r'page=(\d+)', url)
     if match:
         return int(match.group(1))
@@ -365,6 +698,53 @@ def format_authors(authors: List[str]) -> str:
     return ", ".join(clean_authors)
 
 
+def load_cached_total_pages(seed_url: str) -> Optional[int]:
+    """Return the cached total page count for seed_url if it is still fresh."""
+    try:
+        if time.time() - PAGINATION_CACHE.stat().st_mtime > PAGINATION_CACHE_TTL:
+            return None
+        with PAGINATION_CACHE.open("rb") as f:
+            cached = pickle.load(f)
+        if cached.get("seed_url") != seed_url or cached.get("date") != date.today().isoformat():
+            return None
+        return int(cached["total_pages"])
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable pagination cache: {e}")
+        return None
+
+
+def save_cached_total_pages(seed_url: str, total_pages: int):
+    """Persist the detected total page count for seed_url."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with PAGINATION_CACHE.open("wb") as f:
+            pickle.dump({"seed_url": seed_url, "date": date.today().isoformat(), "total_pages": total_pages}, f)
+    except Exception as e:
+        logger.debug(f"Failed to write pagination cache: {e}")
+
+
+def load_cached_driver_path() -> Optional[str]:
+    """Return the ChromeDriver path saved by an earlier run if it is still executable."""
+    try:
+        driver_path = DRIVER_PATH_CACHE.read_text().strip()
+    except OSError:
+        return None
+    if driver_path and os.access(driver_path, os.X_OK):
+        return driver_path
+    return None
+
+
+def save_cached_driver_path(driver_path: str):
+    """Remember the resolved ChromeDriver path so later runs skip webdriver-manager."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        DRIVER_PATH_CACHE.write_text(driver_path)
+    except Exception as e:
+        logger.debug(f"Failed to write driver path cache: {e}")
+
+
 def create_backup_file(file_path: Path):
     """Create a backup of existing file if it exists."""
     if file_path.exists():
@@ -378,45 +758,44 @@ def create_backup_file(file_path: Path):
 
 def get_crawling_statistics(data: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Generate crawling statistics."""
-    if not data:
-        return {
-            "total_publications": 0,
-            "unique_authors": 0,
-            "year_range": "",
-            "pages_crawled": 0
-        }
-    
-    # Count total publications
-    total_publications = len(data)
+    stats = CrawlingStatistics()
+    stats.add(data)
+    return stats.summary()
+
+
+class CrawlingStatistics:
+    """Running crawl statistics, updated page by page so publications need not be kept."""
+    def __init__(self):
+        self.total_publications = 0
+        self._authors: set = set()
+        self._min_year = None
+        self._max_year = None
+        self._pages: set = set()
     
-    # Count unique authors
-    all_authors = []
-    for pub in data:
-        authors = pub.get("authors", "").split(", ")
-        all_authors.extend([author.strip() for author in authors if author.strip()])
+    def add(self, data: List[Dict[str, Any]]):
+        """Count a batch of publications."""
+        self.total_publications += len(data)
+        for pub in data:
+            self._authors.update(author.strip() for author in pub.get("authors", "").split(", ") if author.strip())
+            year = pub.get("year")
+            if year:
+                if self._min_year is None or year < self._min_year:
+                    self._min_year = year
+                if self._max_year is None or year > self._max_year:
+                    self._max_year = year
+            self._pages.add(pub.get("page_number", 0))
     
-    unique_authors = len(set(all_authors))
-    
-    # Get year range
-    years = [pub.get("year", "") for pub in data if pub.get("year")]
-    year_range = f"{min(years)} - {max(years)}" if years else ""
-    
-    # Count pages crawled
-    pages = set(pub.get("page_number", 0) for pub in data)
-    pages_crawled = len(pages)
-    
-    return {
-        "total_publications": total_publications,
-        "unique_authors": unique_authors,
-        "year_range": year_range,
-        "pages_crawled": pages_crawled
-    }
-
-# robots.txt utilities
-from urllib import robotparser
-from config.settings import RESPECT_ROBOTS, ROBOTS_URL, ROBOTS_USER_AGENT, ROBOTS_FALLBACK_CRAWL_DELAY
+    def summary(self) -> Dict[str, Any]:
+        """Return the statistics in the get_crawling_statistics() format."""
+        return {
+            "total_publications": self.total_publications,
+            "unique_authors": len(self._authors),
+            "year_range": f"{self._min_year} - {self._max_year}" if self._min_year is not None else "",
+            "pages_crawled": len(self._pages)
+        }
 
 
+# robots.txt utilities
 def fetch_text_via_selenium(driver, url: str) -> str:
     """Fetch page content using an existing Selenium driver."""
     try:
@@ -438,6 +817,62 @@ class RobotsPolicy:
         self._crawl_delay = None
         self._fetched = False
         self._unavailable = False
+        # time.monotonic() of the last load(), for ROBOTS_CACHE_TTL
+        self._loaded_at: Optional[float] = None
+        # can_fetch decisions keyed by path + query (the part robots rules match)
+        self._decisions: Dict[str, bool] = {}
+        # Our user agent's rules as one alternation (see _compile_rules)
+        self._rules_re: Optional[re.Pattern] = None
+        self._rule_allowance: Dict[str, bool] = {}
+    
+    def load(self, lines: List[str]):
+        """Parse robots.txt lines fetched by the caller and reset cached decisions."""
+        self.parser = robotparser.RobotFileParser()
+        self.parser.parse(lines)
+        self.parser.set_url(self.robots_url)
+        self._crawl_delay = self.parser.crawl_delay(self.user_agent) or self.parser.crawl_delay("*")
+        self._rules_re, self._rule_allowance = self._compile_rules()
+        self._decisions = {}
+        self._fetched = True
+        self._unavailable = False
+        self._loaded_at = time.monotonic()
+    
+    def is_stale(self) -> bool:
+        """Return True when the loaded rules are older than ROBOTS_CACHE_TTL and should be fetched again."""
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at > ROBOTS_CACHE_TTL
+    
+    def _compile_rules(self):
+        """
+        Compile the rule lines that apply to our user agent into one regex.
+        
+        robotparser walks the rule list for every URL and the first rule whose path
+        prefixes the URL decides. Each rule becomes a named alternative in file order,
+        so re.match picks the same rule; its group name maps to the allowance.
+        
+        Returns:
+            (compiled pattern or None when no rules apply, group name -> allowance)
+        """
+        entry = next((e for e in self.parser.entries if e.applies_to(self.user_agent)), None)
+        if entry is None:
+            entry = self.parser.default_entry
+        if entry is None or not entry.rulelines:
+            return None, {}
+        alternatives = []
+        allowance = {}
+        for i, rule in enumerate(entry.rulelines):
+            name = f"r{i}"
+            # robotparser treats a bare "*" path as matching everything
+            prefix = "" if rule.path == "*" else re.escape(rule.path)
+            alternatives.append(f"(?P<{name}>{prefix})")
+            allowance[name] = rule.allowance
+        return re.compile("|".join(alternatives)), allowance
+    
+    def _allowed(self, url: str) -> bool:
+        """Evaluate url against the compiled rules, normalizing it like robotparser does."""
+        parsed = urlparse(unquote(url))
+        path = quote(urlunparse(("", "", parsed.path, parsed.params, parsed.query, parsed.fragment))) or "/"
+        match = self._rules_re.match(path)
+        return self._rule_allowance[match.lastgroup] if match else True
     
     def fetch(self):
         """Mark robots as needing Selenium-based fetch; no direct HTTP used."""
@@ -458,10 +893,19 @@ class RobotsPolicy:
             self.fetch()
         if self._unavailable:
             return True
-        try:
-            return self.parser.can_fetch(self.user_agent, url)
-        except Exception:
-            return True
+        parts = urlsplit(url)
+        key = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        allowed = self._decisions.get(key)
+        if allowed is None:
+            try:
+                if self._rules_re is not None:
+                    allowed = self._allowed(url)
+                else:
+                    allowed = self.parser.can_fetch(self.user_agent, url)
+            except Exception:
+                allowed = True
+            self._decisions[key] = allowed
+        return allowed
     
     def crawl_delay_seconds(self) -> float:
         if not RESPECT_ROBOTS: